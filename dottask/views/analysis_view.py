@@ -487,15 +487,6 @@ class AnalysisView(BaseView):
         fname = f"gaze_analysis{suffix}_{ts}.png"
         pygame.image.save(self.screen, fname)
 
-    def draw_grid(self) -> None:
-        """
-        Draws a grid across the background to help situate the user’s eye data visually.
-        """
-        for x in range(0, self.width, 50):
-            pygame.draw.line(self.screen, self.GRID_COLOR, (x, 0), (x, self.height))
-        for y in range(0, self.height, 50):
-            pygame.draw.line(self.screen, self.GRID_COLOR, (0, y), (self.width, y))
-
     def _handle_hover(self,
                       mouse_pos: Tuple[int, int],
                       fixations: List[Fixation],
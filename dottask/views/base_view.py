@@ -9,8 +9,42 @@
 # It also provides utility methods for grid drawing, text rendering.
 # =========================================================================================
 
+import numpy as np
 import pygame
-from typing import Tuple
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Sub-pixel (dx, dy) offsets of the 5x5 circles that draw_aa_circle layers for smoothing
+_AA_OFFSETS = tuple((i * 0.25, j * 0.25) for i in range(-2, 3) for j in range(-2, 3))
+
+
+def _make_grid_drawer(width: int,
+                      height: int,
+                      spacing: int,
+                      color: Tuple[int, int, int]) -> Callable[[pygame.Surface], None]:
+    """
+    Build a grid drawing function with the screen size, spacing and color baked in,
+    so the per-frame loop only touches locals.
+
+    Args:
+        width (int): Width of the grid area in pixels.
+        height (int): Height of the grid area in pixels.
+        spacing (int): Distance in pixels between grid lines.
+        color (Tuple[int,int,int]): RGB color of the grid lines.
+
+    Returns:
+        Callable[[pygame.Surface], None]: Function drawing the grid onto a surface.
+    """
+    line = pygame.draw.line
+    xs = range(0, width, spacing)
+    ys = range(0, height, spacing)
+
+    def draw(screen: pygame.Surface) -> None:
+        for x in xs:
+            line(screen, color, (x, 0), (x, height))
+        for y in ys:
+            line(screen, color, (0, y), (width, y))
+
+    return draw
 
 class BaseView:
     """
@@ -18,7 +52,11 @@ class BaseView:
     Provides common functionality for drawing and display management.
     """
 
-    def __init__(self, screen: pygame.Surface, width: int, height: int):
+    def __init__(self,
+                 screen: pygame.Surface,
+                 width: int,
+                 height: int,
+                 use_colorkey: bool = False):
         """
         Initialize the base view with common properties and surfaces.
 
@@ -26,6 +64,11 @@ class BaseView:
             screen (pygame.Surface): The pygame display surface (main window or sub-surface).
             width (int): The width of the screen in pixels.
             height (int): The height of the screen in pixels.
+            use_colorkey (bool): Create the dot and gaze surfaces in the display format with
+                black as colorkey instead of per-pixel alpha. They blit through SDL's fast
+                opaque path, but only fully opaque drawing is supported: alpha values are
+                ignored and pure black pixels are transparent. Keep the default for
+                alpha-blended dots.
         """
         self.screen = screen
         self.width = width
@@ -42,10 +85,27 @@ class BaseView:
         self.GRID_COLOR = (40, 40, 60)     # Dark blue-grey for grid lines
         
         # Create transparent surfaces for layered drawing (e.g., gaze dots vs. background)
-        self.dot_surface = pygame.Surface((width, height), pygame.SRCALPHA, 32)
-        self.gaze_surface = pygame.Surface((width, height), pygame.SRCALPHA, 32)
-        self.dot_surface = self.dot_surface.convert_alpha()
-        self.gaze_surface = self.gaze_surface.convert_alpha()
+        if use_colorkey:
+            self.dot_surface = pygame.Surface((width, height)).convert()
+            self.gaze_surface = pygame.Surface((width, height)).convert()
+            self.dot_surface.set_colorkey((0, 0, 0))
+            self.gaze_surface.set_colorkey((0, 0, 0))
+        else:
+            self.dot_surface = pygame.Surface((width, height), pygame.SRCALPHA, 32)
+            self.gaze_surface = pygame.Surface((width, height), pygame.SRCALPHA, 32)
+            self.dot_surface = self.dot_surface.convert_alpha()
+            self.gaze_surface = self.gaze_surface.convert_alpha()
+
+        # Specialized grid drawers per (spacing, color), built on first use
+        self._grid_drawers: Dict[Tuple[int, Tuple[int, int, int]],
+                                 Callable[[pygame.Surface], None]] = {}
+
+        # Rects drawn on each layer surface since its last clear (overlapping rects merged)
+        self._dirty_rects: Dict[pygame.Surface, List[pygame.Rect]] = {}
+
+        # Pixel masks of draw_aa_circle's layered circles per integer radius, oldest evicted first
+        self.DOT_MASK_CACHE_SIZE = 64
+        self._dot_masks: Dict[int, np.ndarray] = {}
 
     def draw_aa_circle(self,
                        surface: pygame.Surface,
@@ -63,15 +123,86 @@ class BaseView:
             color (Tuple[int,int,int,int]): RGBA color tuple for the circle.
         """
         x, y = center
-        for i in range(-2, 3):
-            for j in range(-2, 3):
-                pygame.draw.circle(
-                    surface,
-                    color,
-                    (int(x + i * 0.25), int(y + j * 0.25)),
-                    radius,
-                    0
-                )
+        circle = pygame.draw.circle
+        for dx, dy in _AA_OFFSETS:
+            circle(surface, color, (int(x + dx), int(y + dy)), radius, 0)
+
+        # The offsets stay within one pixel of the center; radius may be fractional
+        extent = int(radius) + 2
+        self.register_dirty(surface, pygame.Rect(int(x) - extent, int(y) - extent,
+                                                 2 * extent + 1, 2 * extent + 1))
+
+    def _get_dot_mask(self, radius: float) -> np.ndarray:
+        """
+        Return the boolean [x, y] mask of the pixels draw_aa_circle covers around an
+        integer center, which sits at (extent, extent) with extent = int(radius) + 2.
+
+        Masks are cached per integer radius: pygame.draw.circle truncates a fractional
+        radius, so e.g. an animated radius maps to the same few masks.
+
+        Args:
+            radius (float): Circle radius in pixels.
+
+        Returns:
+            np.ndarray: Square boolean mask of side 2 * extent + 1.
+        """
+        radius = int(radius)  # Truncated like pygame.draw.circle does
+        mask = self._dot_masks.get(radius)
+        if mask is None:
+            extent = radius + 2
+            scratch = pygame.Surface((2 * extent + 1, 2 * extent + 1))
+            # Same layered circles as the drawing path, in white on black
+            for dx, dy in _AA_OFFSETS:
+                pygame.draw.circle(scratch, (255, 255, 255),
+                                   (int(extent + dx), int(extent + dy)), radius, 0)
+            mask = pygame.surfarray.array_red(scratch) > 0
+            if len(self._dot_masks) >= self.DOT_MASK_CACHE_SIZE:
+                del self._dot_masks[next(iter(self._dot_masks))]
+            self._dot_masks[radius] = mask
+        return mask
+
+    def stamp_dots(self,
+                   surface: pygame.Surface,
+                   dots: List[Tuple[Tuple[int, int], float, Tuple[int, ...]]]) -> None:
+        """
+        Draw a sequence of dots exactly like consecutive draw_aa_circle calls, but by
+        writing cached circle masks straight into numpy views of the surface pixels.
+        The views are taken once for the whole batch, so the rasterizer is skipped
+        entirely. Covered pixels are overwritten, as with pygame.draw.circle.
+
+        Falls back to draw_aa_circle for surfaces without per-pixel alpha.
+
+        Args:
+            surface (pygame.Surface): Surface to draw on.
+            dots (List[Tuple[Tuple[int,int], float, Tuple[int,...]]]): (center, radius,
+                color) of each dot, in drawing order. Centers must be integers.
+        """
+        if not surface.get_flags() & pygame.SRCALPHA:
+            for center, radius, color in dots:
+                self.draw_aa_circle(surface, center, radius, color)
+            return
+
+        bounds = surface.get_rect()
+        map_rgb = surface.map_rgb  # Returns a signed int; masked to the uint32 pixel value below
+        # Packed 32-bit pixels, so color and alpha are written with a single assignment
+        pixels = pygame.surfarray.pixels2d(surface)
+        for (x, y), radius, color in dots:
+            mask = self._get_dot_mask(radius)
+            extent = mask.shape[0] // 2
+
+            # Clip the mask to the surface
+            rect = pygame.Rect(x - extent, y - extent, mask.shape[0], mask.shape[1])
+            clipped = rect.clip(bounds)
+            if not clipped:
+                continue
+            if clipped != rect:
+                mask = mask[clipped.left - rect.left:clipped.right - rect.left,
+                            clipped.top - rect.top:clipped.bottom - rect.top]
+
+            region = pixels[clipped.left:clipped.right, clipped.top:clipped.bottom]
+            region[mask] = map_rgb(color) & 0xFFFFFFFF
+            self.register_dirty(surface, clipped)
+        del pixels  # Release the surface lock
 
     def draw_text(self,
                   text: str,
@@ -106,19 +237,52 @@ class BaseView:
         Args:
             spacing (int): Distance in pixels between grid lines.
         """
-        for x in range(0, self.width, spacing):
-            pygame.draw.line(self.screen, self.GRID_COLOR, (x, 0), (x, self.height))
-        for y in range(0, self.height, spacing):
-            pygame.draw.line(self.screen, self.GRID_COLOR, (0, y), (self.width, y))
+        key = (spacing, self.GRID_COLOR)
+        drawer = self._grid_drawers.get(key)
+        if drawer is None:
+            drawer = _make_grid_drawer(self.width, self.height, spacing, self.GRID_COLOR)
+            self._grid_drawers[key] = drawer
+        drawer(self.screen)
+
+    def register_dirty(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
+        """
+        Record an area of a layer surface that was drawn to, so clear_surface only
+        has to fill that area. Rects overlapping already recorded ones are merged.
+
+        Args:
+            surface (pygame.Surface): The surface that was drawn to.
+            rect (pygame.Rect): The modified area, e.g. as returned by pygame.draw.
+        """
+        rect = pygame.Rect(rect)
+        if not rect:
+            return
+        rects = self._dirty_rects.setdefault(surface, [])
+        overlapping = rect.collidelistall(rects)
+        if overlapping:
+            rect.unionall_ip([rects[i] for i in overlapping])
+            for i in reversed(overlapping):
+                del rects[i]
+        rects.append(rect)
 
     def clear_surface(self, surface: pygame.Surface) -> None:
         """
         Clear a surface by filling it with transparent pixels.
 
+        Only the rects registered since the last clear are filled; the first clear of
+        a surface fills all of it. On colorkey surfaces the fill maps to black, which
+        is the transparent colorkey.
+
         Args:
             surface (pygame.Surface): The surface to clear.
         """
-        surface.fill((0, 0, 0, 0))
+        rects: Optional[List[pygame.Rect]] = self._dirty_rects.get(surface)
+        if rects is None:
+            surface.fill((0, 0, 0, 0))
+            self._dirty_rects[surface] = []
+            return
+        for rect in rects:
+            surface.fill((0, 0, 0, 0), rect)
+        rects.clear()
 
     def get_screen_dimensions(self) -> Tuple[int, int]:
         """
@@ -245,15 +245,6 @@ class HeatmapView(BaseView):
                 label_surf = self.FONT.render(f"{completion_times[i]:.1f}s", True, self.TEXT_COLOR)
                 self.screen.blit(label_surf, (pos[0] + 20, pos[1] - 10))
 
-    def draw_grid(self) -> None:
-        """
-        Draw a background grid to provide spatial reference.
-        """
-        for x in range(0, self.width, 50):
-            pygame.draw.line(self.screen, self.GRID_COLOR, (x, 0), (x, self.height))
-        for y in range(0, self.height, 50):
-            pygame.draw.line(self.screen, self.GRID_COLOR, (0, y), (self.width, y))
-
     def start_generation(self, gaze_points: List[GazePoint]) -> None:
         """
         Initiate heatmap generation in a background thread.
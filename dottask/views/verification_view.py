@@ -23,7 +23,11 @@ class VerificationView(BaseView):
     user gaze in real time. Used for conducting the dot task.
     """
 
-    def __init__(self, screen: pygame.Surface, width: int, height: int):
+    def __init__(self,
+                 screen: pygame.Surface,
+                 width: int,
+                 height: int,
+                 use_colorkey: bool = False):
         """
         Initialize the verification view with display properties and visuals.
 
@@ -31,8 +35,10 @@ class VerificationView(BaseView):
             screen (pygame.Surface): The main pygame surface to draw on.
             width (int): Screen width in pixels.
             height (int): Screen height in pixels.
+            use_colorkey (bool): Use colorkey instead of per-pixel alpha for the dot and
+                gaze surfaces (see BaseView). Disables the semi-transparent glow effects.
         """
-        super().__init__(screen, width, height)
+        super().__init__(screen, width, height, use_colorkey)
         
         # Verification-specific constants
         self.DOT_RADIUS = 15
@@ -97,22 +103,18 @@ class VerificationView(BaseView):
         current_radius = self.DOT_RADIUS * size_multiplier
         
         # Outer glow: draw multiple circles with varying alpha to create a glow effect
+        dots = []
         for radius in range(int(current_radius) + 8, int(current_radius) - 4, -1):
             alpha_mod = int(alpha * (radius / (current_radius + 8)) * 0.8)
-            self.draw_aa_circle(
-                self.dot_surface,
-                position,
-                radius,
-                (*self.DOT_COLOR, alpha_mod)
-            )
+            dots.append((position, radius, (*self.DOT_COLOR, alpha_mod)))
         
         # Core solid dot
-        self.draw_aa_circle(
-            self.dot_surface,
+        dots.append((
             position,
             max(1, current_radius - 2),  # Ensure radius doesn't go below 1
             (*self.DOT_COLOR, alpha)
-        )
+        ))
+        self.stamp_dots(self.dot_surface, dots)
         
         self.screen.blit(self.dot_surface, (0, 0))
 
@@ -147,23 +149,21 @@ class VerificationView(BaseView):
                 )
                 
                 # Draw a line to the next point in the trail
-                pygame.draw.line(
+                line_rect = pygame.draw.line(
                     self.gaze_surface,
                     (*self.GAZE_COLOR, alpha),
                     points[i],
                     points[i + 1],
                     2
                 )
+                self.register_dirty(self.gaze_surface, line_rect)
         
         # Draw the current gaze position with a glowing effect
+        glow = []
         for radius in range(self.GAZE_RADIUS + 12, self.GAZE_RADIUS - 12, -1):
             alpha = int(130 * (radius / self.GAZE_RADIUS))
-            self.draw_aa_circle(
-                self.gaze_surface,
-                current_gaze,
-                radius,
-                (*self.GAZE_COLOR, alpha)
-            )
+            glow.append((current_gaze, radius, (*self.GAZE_COLOR, alpha)))
+        self.stamp_dots(self.gaze_surface, glow)
         
         # Blit the gaze overlay
         self.screen.blit(self.gaze_surface, (0, 0))
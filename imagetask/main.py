@@ -12,11 +12,14 @@
 
 import os
 import time
+import queue
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np  
 import pygame
+from PIL import Image
 import tobii_research as tr  # Requires Tobii SDK.
 
 # Configure logging to capture and display debug information
@@ -47,11 +50,14 @@ def compute_rms_brightness(image_path: str) -> float:
         float: The RMS brightness value of the image, or 0.0 if an error occurs.
     """
     try:
-        # Attempt to load the image from the provided path using Pygame.
-        surf = pygame.image.load(image_path)
-        
-        # Convert the loaded image to a 3D NumPy array of float32 type for numerical processing.
-        arr = pygame.surfarray.array3d(surf).astype(np.float32)
+        # Decode with PIL; no Surface is needed since only a scalar is kept.
+        with Image.open(image_path) as im:
+            # Let libjpeg decode at reduced resolution; the mean barely changes.
+            im.draft("RGB", (256, 256))
+            # The value is only used as a sort key, so a small thumbnail is precise enough.
+            im.thumbnail((128, 128), Image.BILINEAR)
+            # Convert to a 3D NumPy array of float32 type for numerical processing.
+            arr = np.asarray(im.convert("RGB"), dtype=np.uint8).astype(np.float32)
 
         # Compute grayscale intensity for each pixel:
         #   gray = 0.299*R + 0.587*G + 0.114*B
@@ -111,6 +117,9 @@ class GazeImageViewer:
         self.gaze_data_per_image = []  # List of lists, each sublist storing gaze data for a single image.
         self.current_image_data = []   # Temporary storage for the currently displayed image.
 
+        # Raw samples handed over from the Tobii SDK thread; drained once per frame on the main thread.
+        self._gaze_q: queue.SimpleQueue = queue.SimpleQueue()
+
         # Flag to control brightness-based image sorting.
         self.sort_by_brightness = sort_by_brightness
 
@@ -163,7 +172,12 @@ class GazeImageViewer:
         # If brightness-based ordering is requested, re-sort using the RMS brightness measure.
         if self.sort_by_brightness:
             logger.debug("Sorting images by brightness (darkest to brightest).")
-            image_files.sort(key=lambda path: compute_rms_brightness(path))
+            # Decode in parallel (PIL releases the GIL while decoding), then sort the indices.
+            with ThreadPoolExecutor() as executor:
+                brightnesses = list(executor.map(compute_rms_brightness, image_files))
+            # A stable sort keeps the alphabetical order for images of equal brightness.
+            order = np.argsort(brightnesses, kind="stable")
+            image_files = [image_files[i] for i in order]
 
         # Ensure that we have at least one suitable image file.
         if not image_files:
@@ -178,6 +192,9 @@ class GazeImageViewer:
         """
         Callback function invoked whenever new gaze data is received from the Tobii device.
 
+        Runs on the Tobii SDK thread, so it only enqueues the raw sample together with its
+        arrival time. Processing happens on the main thread in `drain_gaze_queue`.
+
         Args:
             gaze_data (dict): Dictionary typically containing keys like
                               'left_gaze_point_on_display_area' and
@@ -185,7 +202,18 @@ class GazeImageViewer:
         """
         # Only record gaze data if we are currently in the image task phase.
         if self.current_view == "image_task":
-            self.gaze_processor.process_gaze_data(gaze_data)
+            self._gaze_q.put((gaze_data, time.monotonic_ns()))
+
+    def drain_gaze_queue(self) -> None:
+        """
+        Process all gaze samples queued by the Tobii callback since the last frame.
+        """
+        while True:
+            try:
+                gaze_data, timestamp = self._gaze_q.get_nowait()
+            except queue.Empty:
+                break
+            self.gaze_processor.process_gaze_data(gaze_data, timestamp)
             if self.gaze_processor.current_gaze:
                 # Append the latest smoothed gaze position (int, int) to the current image's data list.
                 self.current_image_data.append(self.gaze_processor.current_gaze)
@@ -201,11 +229,15 @@ class GazeImageViewer:
             self.finish_task_and_switch_to_analysis()
             return
 
+        # Pull in all gaze samples that arrived since the previous frame.
+        self.drain_gaze_queue()
+
         # If the current image's duration has elapsed, store the gaze data and proceed.
         if self.image_task_view.check_image_complete():
             logger.debug(f"Completed image #{self.image_task_view.current_idx}. Storing gaze data.")
-            self.gaze_data_per_image.append(self.current_image_data.copy())
-            self.current_image_data.clear()
+            # Hand the list over to the history and start a fresh one instead of copying it.
+            self.gaze_data_per_image.append(self.current_image_data)
+            self.current_image_data = []
             self.image_task_view.next_image()
 
             # Check if we've now shown all images.
@@ -218,7 +250,8 @@ class GazeImageViewer:
         self.image_task_view.draw(
             current_gaze=self.gaze_processor.current_gaze,
             gaze_history=self.gaze_processor.gaze_history,
-            remaining_images=self.image_task_view.remaining_images()
+            remaining_images=self.image_task_view.remaining_images(),
+            history_version=self.gaze_processor.history_version
         )
 
     def finish_task_and_switch_to_analysis(self) -> None:
@@ -262,9 +295,16 @@ class GazeImageViewer:
         and returning to the first phase of the experiment (the image task).
         """
         logger.info("Resetting session and returning to image task view.")
+        # Discard any samples that were queued before the reset.
+        while True:
+            try:
+                self._gaze_q.get_nowait()
+            except queue.Empty:
+                break
         self.gaze_data_per_image.clear()
         self.current_image_data.clear()
         self.gaze_processor.reset()
+        self.image_task_view.cleanup()
         self.image_task_view.reset()
         self.analysis_view.cleanup()
         self.current_view = "image_task"
@@ -276,6 +316,7 @@ class GazeImageViewer:
         """
         logger.info("Cleaning up GazeImageViewer. Unsubscribing from Tobii, shutting down Pygame.")
         self.eyetracker.unsubscribe_from(tr.EYETRACKER_GAZE_DATA, self.gaze_data_callback)
+        self.image_task_view.cleanup()
         self.analysis_view.cleanup()
         pygame.quit()
 
@@ -292,6 +333,12 @@ class GazeImageViewer:
             as_dictionary=True
         )
 
+        # Only QUIT, KEYDOWN and window expose events are handled; keep every other event
+        # type off the queue so the filtered get() below never lets unread events accumulate.
+        handled_events = [pygame.QUIT, pygame.KEYDOWN, pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE]
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(handled_events)
+
         clock = pygame.time.Clock()
         running = True
 
@@ -300,11 +347,16 @@ class GazeImageViewer:
                 # Run at up to 60 frames per second to keep UI rendering smooth.
                 clock.tick(60)
 
-                # Handle all pending Pygame events.
-                for event in pygame.event.get():
+                # Handle pending QUIT, KEYDOWN and expose events; other types are dropped in C.
+                for event in pygame.event.get(handled_events):
                     if event.type == pygame.QUIT:
                         logger.info("Received QUIT event; exiting main loop.")
                         running = False
+                    elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                        # The window was uncovered or restored and its content may be damaged;
+                        # the views skip unchanged frames, so force both to redraw in full.
+                        self.analysis_view.invalidate()
+                        self.image_task_view.invalidate()
                     elif event.type == pygame.KEYDOWN:
                         # Escape key closes the application.
                         if event.key == pygame.K_ESCAPE:
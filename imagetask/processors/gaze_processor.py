@@ -18,11 +18,11 @@ class GazePoint:
     Represents a single gaze point measurement.
 
     Attributes:
-        timestamp (float): The Unix timestamp when this point was recorded.
+        timestamp (int): Monotonic clock reading in nanoseconds when this point was recorded.
         position (Tuple[int, int]): (x, y) pixel coordinates on the screen.
         velocity (float): Gaze movement velocity in pixels per second.
     """
-    timestamp: float
+    timestamp: int
     position: Tuple[int, int]
     velocity: float
 
@@ -47,17 +47,21 @@ class GazeProcessor:
         # Screen dimensions
         self.width = screen_width
         self.height = screen_height
+        # Half-dimensions as floats, so averaging both eyes and scaling to pixels is one multiply
+        self._half_w = self.width * 0.5
+        self._half_h = self.height * 0.5
 
         # Smoothing factor for visual display; determines the weight of new data
         self.SMOOTHING_FACTOR = 0.15
 
         # Visualization buffers
         self.gaze_history: Deque[Tuple[int, int]] = deque(maxlen=25)  # Stores recent gaze positions for a "trail" effect
+        self.history_version = 0                                      # Incremented whenever gaze_history changes
         self.current_gaze: Optional[Tuple[int, int]] = None           # Latest smoothed gaze position for rendering
         self.smoothed_gaze: Optional[Tuple[float, float]] = None      # Internal state for position smoothing calculations
 
         # Timing and data collection
-        self.last_gaze_time: Optional[float] = None
+        self.last_gaze_time: Optional[int] = None  # Monotonic timestamp in nanoseconds
         self.raw_gaze_points: List[GazePoint] = []  # All raw gaze points for offline analysis
         self.is_recording = True                    # Flag indicating whether recording is active
 
@@ -112,7 +116,7 @@ class GazeProcessor:
         distance = np.sqrt(dx * dx + dy * dy)
         return distance / dt
 
-    def process_gaze_data(self, gaze_data: Dict) -> None:
+    def process_gaze_data(self, gaze_data: Dict, timestamp: Optional[int] = None) -> None:
         """
         Process and store a single sample of gaze data when recording is active.
 
@@ -126,6 +130,8 @@ class GazeProcessor:
                     'right_gaze_point_on_display_area': (rx, ry)
                 }
                 Each coordinate is in the [0, 1] range, relative to the display.
+            timestamp (Optional[int]): `time.monotonic_ns()` reading taken when the sample
+                was received. Defaults to the current monotonic time if omitted.
         """
         if not self.is_recording:
             return  # Ignore data if recording is inactive
@@ -133,7 +139,7 @@ class GazeProcessor:
         # Extract left and right eye gaze points
         left_eye = gaze_data.get('left_gaze_point_on_display_area')
         right_eye = gaze_data.get('right_gaze_point_on_display_area')
-        current_time = time.time()
+        current_time = time.monotonic_ns() if timestamp is None else timestamp
 
         # Proceed only if both eyes have valid coordinates within the normalized [0, 1] range
         if left_eye and right_eye:
@@ -141,17 +147,18 @@ class GazeProcessor:
             right_x, right_y = right_eye
 
             # Validate that all coordinates are within the normalized range
-            if all(0.0 <= coord <= 1.0 for coord in [left_x, left_y, right_x, right_y]):
+            if (0.0 <= left_x <= 1.0 and 0.0 <= left_y <= 1.0
+                    and 0.0 <= right_x <= 1.0 and 0.0 <= right_y <= 1.0):
                 # Convert normalized [0,1] coordinates to screen pixel coordinates
-                x = (left_x + right_x) / 2 * self.width
-                y = (left_y + right_y) / 2 * self.height
+                x = (left_x + right_x) * self._half_w
+                y = (left_y + right_y) * self._half_h
                 raw_gaze = (int(x), int(y))
 
                 # Initialize raw velocity
                 raw_velocity = 0.0
                 if self.last_gaze_time is not None and self.raw_gaze_points:
-                    # Calculate time difference since the last gaze point
-                    dt = current_time - self.last_gaze_time
+                    # Calculate time difference since the last gaze point, in seconds
+                    dt = (current_time - self.last_gaze_time) * 1e-9
                     # Retrieve the previous gaze position for velocity calculation
                     prev_point = self.raw_gaze_points[-1].position
                     raw_velocity = self.calculate_velocity(prev_point, raw_gaze, dt)
@@ -171,6 +178,7 @@ class GazeProcessor:
                 self.current_gaze = (int(self.smoothed_gaze[0]), int(self.smoothed_gaze[1]))
                 # Append the current gaze to history for trail visualization
                 self.gaze_history.append(self.current_gaze)
+                self.history_version += 1
                 # Update the timestamp of the last gaze
                 self.last_gaze_time = current_time
         else:
@@ -196,6 +204,7 @@ class GazeProcessor:
         Call this method before starting a new session to remove old data and reset states.
         """
         self.gaze_history.clear()
+        self.history_version += 1
         self.current_gaze = None
         self.smoothed_gaze = None
         self.last_gaze_time = None
@@ -6,8 +6,11 @@
 # grid overlays, and event handling that can be extended by specific view implementations.
 # =========================================================================================
 
+import numpy as np
 import pygame
-from typing import Tuple
+import pygame.freetype
+import pygame.gfxdraw
+from typing import Dict, List, Optional, Tuple
 
 class BaseView:
     """
@@ -32,8 +35,10 @@ class BaseView:
         self.width = width
         self.height = height
         
-        # Initialize font for text rendering; default font with size 36
-        self.font = pygame.font.Font(None, 36)
+        # Initialize font for text rendering; the default font at the size pygame.font.Font(None, 36)
+        # produces. Positions passed to render_to are baseline origins.
+        self.font = pygame.freetype.Font(None, 24)
+        self.font.origin = True
         
         # Define common colors used across different views
         self.BACKGROUND_COLOR = (0, 0, 0)        # Black background
@@ -46,6 +51,79 @@ class BaseView:
         self.dot_surface = pygame.Surface((width, height), pygame.SRCALPHA, 32).convert_alpha()
         self.gaze_surface = pygame.Surface((width, height), pygame.SRCALPHA, 32).convert_alpha()
 
+        # Pre-rendered circle sprites keyed by (radius, color), evicted oldest-first once full
+        self.AA_CIRCLE_CACHE_SIZE = 64
+        self._aa_circle_cache: Dict[
+            Tuple[int, Tuple[int, ...]], Tuple[pygame.Surface, pygame.Surface]
+        ] = {}
+
+        # Rendered text and background surfaces keyed by (text, padding), evicted least recently
+        # used first, so labels drawn every frame stay while e.g. old clock strings drop out
+        self.TEXT_CACHE_SIZE = 32
+        self._text_cache: Dict[Tuple[str, int], Tuple[pygame.Surface, pygame.Surface]] = {}
+        # Semi-transparent text backgrounds keyed by size, shared between strings; evicted
+        # least recently used first with the same limit as the text cache
+        self._text_bg_cache: Dict[Tuple[int, int], pygame.Surface] = {}
+
+        # Rects drawn on each scratch surface since its last clear, with overlapping rects
+        # merged. An empty list means the surface is known to be fully transparent.
+        self._dirty_rects: Dict[pygame.Surface, List[pygame.Rect]] = {}
+
+    def _get_circle_sprites(
+        self,
+        radius: int,
+        color: Tuple[int, ...]
+    ) -> Tuple[pygame.Surface, pygame.Surface]:
+        """
+        Return the cached (punch, circle) sprite pair for a filled circle.
+        
+        The circle is rasterized with pygame.gfxdraw for proper anti-aliased edges.
+        Blitting `punch` with BLEND_RGBA_MULT clears the circle's pixels on the target while
+        leaving everything else untouched; blitting `circle` with BLEND_RGBA_ADD afterwards
+        writes the color, with edge alpha scaled by coverage. Together this reproduces the
+        overwrite behaviour of pygame.draw.circle on per-pixel alpha surfaces. Both sprites are 2*radius + 3 pixels
+        wide, with the circle's center at (radius + 1, radius + 1).
+        
+        Args:
+            radius (int): The radius of the circle in pixels.
+            color (Tuple[int, ...]): The RGB or RGBA color of the circle.
+        
+        Returns:
+            Tuple[pygame.Surface, pygame.Surface]: The punch and circle sprites.
+        """
+        key = (radius, tuple(color))
+        sprites = self._aa_circle_cache.get(key)
+        if sprites is None:
+            size = 2 * radius + 3
+            center = radius + 1
+            # Rasterize white on black once with gfxdraw's anti-aliasing; the red channel
+            # then holds the per-pixel coverage of the circle
+            mask = pygame.Surface((size, size))
+            mask.fill((0, 0, 0))
+            pygame.gfxdraw.aacircle(mask, center, center, radius, (255, 255, 255))
+            pygame.gfxdraw.filled_circle(mask, center, center, radius, (255, 255, 255))
+            coverage = pygame.surfarray.array_red(mask).astype(np.uint16)
+            covered = coverage > 0
+            alpha = color[3] if len(color) > 3 else 255
+
+            punch = pygame.Surface((size, size), pygame.SRCALPHA, 32).convert_alpha()
+            punch_rgb = pygame.surfarray.pixels3d(punch)
+            punch_rgb[...] = np.where(covered, 0, 255)[..., None]
+            del punch_rgb  # Release the surface lock
+            pygame.surfarray.pixels_alpha(punch)[...] = 255 - coverage
+
+            circle = pygame.Surface((size, size), pygame.SRCALPHA, 32).convert_alpha()
+            circle_rgb = pygame.surfarray.pixels3d(circle)
+            circle_rgb[...] = np.where(covered[..., None], np.array(color[:3], dtype=np.uint8), 0)
+            del circle_rgb  # Release the surface lock
+            pygame.surfarray.pixels_alpha(circle)[...] = coverage * alpha // 255
+            sprites = (punch, circle)
+            # Evict the oldest entry once the cache is full
+            if len(self._aa_circle_cache) >= self.AA_CIRCLE_CACHE_SIZE:
+                del self._aa_circle_cache[next(iter(self._aa_circle_cache))]
+            self._aa_circle_cache[key] = sprites
+        return sprites
+
     def draw_aa_circle(
         self,
         surface: pygame.Surface,
@@ -56,9 +134,12 @@ class BaseView:
         """
         Draw an anti-aliased circle on the specified surface.
         
-        Since Pygame does not natively support anti-aliased circles, this method
-        approximates anti-aliasing by drawing multiple smaller circles around the
-        intended position to smooth out the edges.
+        The circle is rendered once into cached sprites per (radius, color) and then
+        stamped onto the surface with two blits, so repeated dots never hit the rasterizer.
+        
+        There is no batched variant for many dots: the gaze trail, the only place drawing
+        several, gives every point its own radius and alpha and interleaves the circles
+        with connecting lines, so consecutive stamps cannot be merged into one blits call.
         
         Args:
             surface (pygame.Surface): The surface on which to draw the circle.
@@ -66,50 +147,140 @@ class BaseView:
             radius (int): The radius of the circle in pixels.
             color (Tuple[int, int, int, int]): The RGBA color of the circle.
         """
+        if radius < 1:
+            return  # Nothing visible to draw
         x, y = center
-        # Iterate over a small grid around the center to create an anti-aliased effect
-        for i in range(-2, 3):
-            for j in range(-2, 3):
-                # Draw smaller circles slightly offset from the center
-                pygame.draw.circle(
-                    surface,
-                    color,
-                    (int(x + i * 0.25), int(y + j * 0.25)),
-                    radius,
-                    0  # Filled circle
-                )
+        punch, circle = self._get_circle_sprites(radius, color)
+        pos = (x - radius - 1, y - radius - 1)
+        surface.blit(punch, pos, special_flags=pygame.BLEND_RGBA_MULT)
+        dirty = surface.blit(circle, pos, special_flags=pygame.BLEND_RGBA_ADD)
+        self.register_dirty(surface, dirty)
 
     def draw_text(
         self,
         text: str,
         position: Tuple[int, int],
-        background_padding: int = 10
-    ) -> None:
+        background_padding: int = 10,
+        cache: bool = True
+    ) -> pygame.Rect:
         """
         Render and draw text on the screen with an optional semi-transparent background.
         
         This method helps in making the text readable against various backgrounds by
-        providing a padded, semi-transparent rectangle behind the text.
+        providing a padded, semi-transparent rectangle behind the text. Rendered surfaces
+        are cached per string, so repeated labels are only rasterized once. Text that changes
+        every frame (e.g. timers) should pass cache=False; it is then drawn straight onto the
+        screen with freetype's render_to, without an intermediate surface.
         
         Args:
             text (str): The text string to render.
             position (Tuple[int, int]): The (x, y) coordinates where the text will be placed.
             background_padding (int, optional): Padding around the text background. Defaults to 10.
+            cache (bool, optional): Whether to cache the rendered text. Defaults to True.
+        
+        Returns:
+            pygame.Rect: The screen area covered by the text and its background.
         """
-        # Render the text surface with the specified text and color
-        text_surface = self.font.render(text, True, self.TEXT_COLOR)
-        text_rect = text_surface.get_rect(topleft=position)
+        if cache:
+            bg_rect, _ = self.screen.blits(self.render_text(text, position, background_padding))
+            return bg_rect
+
+        # Text box is the string's width by the font's line height, so it does not jump
+        # around with the glyphs in the string
+        text_size = (self.font.get_rect(text).width, self.font.get_sized_height())
+        bg_surface = self._get_text_background((
+            text_size[0] + background_padding,
+            text_size[1] + background_padding
+        ))
+        text_rect = pygame.Rect(position, text_size)
+        bg_rect = self.screen.blit(
+            bg_surface, text_rect.inflate(background_padding, background_padding)
+        )
+        self.font.render_to(
+            self.screen,
+            (text_rect.x, text_rect.y + self.font.get_sized_ascender()),
+            text,
+            self.TEXT_COLOR
+        )
+        return bg_rect
+
+    def render_text(
+        self,
+        text: str,
+        position: Tuple[int, int],
+        background_padding: int = 10
+    ) -> List[Tuple[pygame.Surface, pygame.Rect]]:
+        """
+        Return the blits that draw text like draw_text, without drawing them.
+        
+        This lets callers collect several labels and draw them with a single screen.blits
+        call. The surfaces come from the text cache and are rendered on first use.
+        
+        Args:
+            text (str): The text string to render.
+            position (Tuple[int, int]): The (x, y) coordinates where the text will be placed.
+            background_padding (int, optional): Padding around the text background. Defaults to 10.
         
+        Returns:
+            List[Tuple[pygame.Surface, pygame.Rect]]: The background and the text surface
+                with their destination rects, in drawing order.
+        """
+        key = (text, background_padding)
+        cached = self._text_cache.pop(key, None)
+        if cached is None:
+            # Text box is the string's width by the font's line height, so it does not
+            # jump around with the glyphs in the string
+            text_size = (self.font.get_rect(text).width, self.font.get_sized_height())
+            bg_surface = self._get_text_background((
+                text_size[0] + background_padding,
+                text_size[1] + background_padding
+            ))
+
+            # Render the text into a transparent surface with the specified text and color
+            text_surface = pygame.Surface(text_size, pygame.SRCALPHA, 32).convert_alpha()
+            text_surface.fill((0, 0, 0, 0))
+            self.font.render_to(
+                text_surface, (0, self.font.get_sized_ascender()), text, self.TEXT_COLOR
+            )
+            cached = (text_surface, bg_surface)
+            # Evict the least recently used entry once the cache is full
+            if len(self._text_cache) >= self.TEXT_CACHE_SIZE:
+                del self._text_cache[next(iter(self._text_cache))]
+        # (Re-)insert the entry at the end, marking it as the most recently used
+        self._text_cache[key] = cached
+        text_surface, bg_surface = cached
+
+        text_rect = text_surface.get_rect(topleft=position)
         # Inflate the text rectangle to create a background padding
         bg_rect = text_rect.inflate(background_padding, background_padding)
-        # Create a new surface for the background with the inflated size
-        bg_surface = pygame.Surface((bg_rect.width, bg_rect.height))
-        bg_surface.fill((50, 50, 50))  # Dark gray background
-        bg_surface.set_alpha(128)       # Semi-transparent
+
+        # The background rectangle first, then the text on top
+        return [(bg_surface, bg_rect), (text_surface, text_rect)]
+
+    def _get_text_background(self, size: Tuple[int, int]) -> pygame.Surface:
+        """
+        Return the shared semi-transparent background surface of the given size.
         
-        # Blit the background rectangle and then the text on top
-        self.screen.blit(bg_surface, bg_rect)
-        self.screen.blit(text_surface, text_rect)
+        Args:
+            size (Tuple[int, int]): Width and height of the background in pixels.
+        
+        Returns:
+            pygame.Surface: The background surface.
+        """
+        bg_surface = self._text_bg_cache.pop(size, None)
+        if bg_surface is None:
+            # Same pixel format as the screen and no per-pixel alpha, so SDL can use its
+            # vectorized blitters, which only handle specific format pairs; the 50%
+            # transparency is a surface alpha set once here
+            bg_surface = pygame.Surface(size, 0, self.screen)
+            bg_surface.fill((50, 50, 50))  # Dark gray
+            bg_surface.set_alpha(128)
+            # Evict the least recently used entry once the cache is full
+            if len(self._text_bg_cache) >= self.TEXT_CACHE_SIZE:
+                del self._text_bg_cache[next(iter(self._text_bg_cache))]
+        # (Re-)insert the entry at the end, marking it as the most recently used
+        self._text_bg_cache[size] = bg_surface
+        return bg_surface
 
     def draw_grid(self, spacing: int = 50) -> None:
         """
@@ -127,16 +298,75 @@ class BaseView:
         for y in range(0, self.height, spacing):
             pygame.draw.line(self.screen, self.GRID_COLOR, (0, y), (self.width, y))
 
-    def clear_surface(self, surface: pygame.Surface) -> None:
+    def register_dirty(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
+        """
+        Record that `rect` on `surface` was drawn to since the surface was last cleared.
+        
+        draw_aa_circle does this automatically; subclasses that draw on
+        a scratch surface by other means should report the rects returned by pygame.draw.
+        A rect that overlaps already recorded rects is merged with them, so the list stays
+        short and clear_surface does not fill the same pixels twice.
+        
+        Args:
+            surface (pygame.Surface): The surface that was drawn to.
+            rect (pygame.Rect): The area that was modified.
+        """
+        rect = pygame.Rect(rect)
+        if not rect:
+            return  # Nothing was drawn
+        rects = self._dirty_rects.setdefault(surface, [])
+        overlapping = rect.collidelistall(rects)
+        if overlapping:
+            rect.unionall_ip([rects[i] for i in overlapping])
+            for i in reversed(overlapping):
+                del rects[i]
+        rects.append(rect)
+
+    def clear_surface(self, surface: pygame.Surface, rect: Optional[pygame.Rect] = None) -> None:
         """
         Clear the specified surface by filling it with a fully transparent color.
         
         This is useful for resetting temporary surfaces before redrawing new content.
+        Only the rects registered since the previous clear are filled; a surface that has
+        never been cleared through this method is filled completely.
         
         Args:
             surface (pygame.Surface): The surface to clear.
+            rect (Optional[pygame.Rect]): Area to clear. Defaults to the registered dirty rects.
+        """
+        # A mapped color of 0 is fully transparent black on per-pixel alpha surfaces, and
+        # skips converting an RGBA tuple on every fill
+        if rect is not None:
+            surface.fill(0, rect)
+            return
+
+        rects = self._dirty_rects.get(surface)
+        if rects is None:
+            surface.fill(0)  # Fully transparent
+            self._dirty_rects[surface] = []
+            return
+        for dirty in rects:
+            surface.fill(0, dirty)
+        rects.clear()
+
+    def blit_dirty(self, surface: pygame.Surface) -> List[pygame.Rect]:
+        """
+        Blit a scratch surface onto the screen, limited to the rects drawn since its last clear.
+        
+        Everything outside the registered rects is transparent, so blitting only those
+        areas gives the same result as blitting the whole surface. A surface that has never
+        been cleared through clear_surface is blitted completely.
+        
+        Args:
+            surface (pygame.Surface): The scratch surface to overlay onto the screen.
+        
+        Returns:
+            List[pygame.Rect]: The screen areas that were blitted to.
         """
-        surface.fill((0, 0, 0, 0))  # Fully transparent
+        rects = self._dirty_rects.get(surface)
+        if rects is None:
+            return [self.screen.blit(surface, (0, 0))]
+        return self.screen.blits([(surface, rect, rect) for rect in rects])
 
     def get_screen_dimensions(self) -> Tuple[int, int]:
         """
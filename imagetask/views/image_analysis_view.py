@@ -3,23 +3,187 @@
 #
 # Provides the ImageAnalysisView class, which displays and manages heatmaps overlaid on their
 # corresponding images. Once all images are shown in the image task phase, this view is presented.
-# It generates each heatmap in a background thread using a ThreadPoolExecutor and displays a
-# loading screen until generation is complete. Users can navigate between heatmaps using the
+# It generates the heatmaps in batches on background threads using a ThreadPoolExecutor and
+# displays a loading screen until generation is complete. Users can navigate between heatmaps using the
 # LEFT and RIGHT arrow keys.
 # =========================================================================================
 
+import functools
+import math
 import pygame
 import numpy as np
 from typing import List, Tuple, Optional
 from dataclasses import dataclass
-import threading
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 import queue
 import time
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; heatmaps fall back to the NumPy implementation
+    njit = None
+
 from .base_view import BaseView
 
 
+if njit is not None:
+    # Compiled at import time (signature given) and cached on disk across runs; releases the
+    # GIL so heatmaps for several images can be computed on the worker threads at once. The
+    # kernel itself is serial: it is called concurrently from the thread pool (and from the
+    # main thread, see _prioritize_heatmap), which Numba's parallel workqueue threading
+    # layer does not support and aborts the process on
+    @njit("void(float32[:], float32[:], float32, float32[:, :])",
+          nogil=True, cache=True, fastmath=True)
+    def _splat_heatmap(xs, ys, sigma, out):
+        """
+        Accumulate a Gaussian for each gaze point into `out`, in grid coordinates.
+        
+        Each Gaussian is truncated at three standard deviations, where it has dropped
+        to about 1% of its peak, so only a small patch around every point is touched.
+        The Gaussian is separable: each point's horizontal profile is computed once, and
+        then scaled by its vertical weight on every row the point's patch covers.
+        
+        Args:
+            xs (np.ndarray): X coordinates of the gaze points in grid cells.
+            ys (np.ndarray): Y coordinates of the gaze points in grid cells.
+            sigma (float): Standard deviation of the Gaussian in grid cells.
+            out (np.ndarray): 2D grid the Gaussians are added to.
+        """
+        rows, cols = out.shape
+        n = xs.shape[0]
+        radius = int(math.ceil(3.0 * sigma))
+        width = 2 * radius + 1
+        inv_two_sigma_sq = np.float32(1.0) / (np.float32(2.0) * sigma * sigma)
+
+        # Horizontal profile of the current point over its patch, starting at column x_start
+        profile = np.empty(width, dtype=np.float32)
+        for k in range(n):
+            x_start = int(xs[k]) - radius
+            for t in range(width):
+                dx = x_start + t - xs[k]
+                profile[t] = math.exp(-dx * dx * inv_two_sigma_sq)
+
+            py = int(ys[k])
+            x0 = max(0, x_start)
+            x1 = min(cols, x_start + width)
+            for j in range(max(0, py - radius), min(rows, py + radius + 1)):
+                dy = j - ys[k]
+                weight = np.float32(math.exp(-dy * dy * inv_two_sigma_sq))
+                for i in range(x0, x1):
+                    out[j, i] += weight * profile[i - x_start]
+else:
+    _splat_heatmap = None
+
+
+@functools.lru_cache(maxsize=4)
+def _gaussian_stamp(sigma: float) -> np.ndarray:
+    """
+    Return one point's Gaussian as a square float32 tile, in grid cells.
+    
+    The Gaussian is truncated at three standard deviations, where it has dropped to about
+    1% of its peak. Tiles are cached per sigma and must not be modified.
+    
+    Args:
+        sigma (float): Standard deviation of the Gaussian in grid cells.
+    
+    Returns:
+        np.ndarray: A (2r + 1, 2r + 1) tile with r = int(3 * sigma), peak at the center.
+    """
+    r = int(3 * sigma)
+    offsets = np.mgrid[-r:r + 1, -r:r + 1]
+    return np.exp(-(offsets**2).sum(0) / (2.0 * sigma**2)).astype(np.float32)
+
+
+def _gen_heatmap_worker(
+    positions_per_image: List[np.ndarray],
+    width: int,
+    height: int,
+    grid_size: int,
+    sigma: float,
+    histogram_min_points: int
+) -> np.ndarray:
+    """
+    Compute the smoothed density maps for a batch of images' gaze points.
+    
+    This function creates a density map from each image's gaze points using Gaussian
+    distribution, normalizes it and quantizes it to 8 bits. All maps share the display's
+    grid shape, so they are stacked into one (M, rows, cols) tensor and the histogram
+    smoothing runs over the whole batch in a single gaussian_filter call. It only
+    depends on its arguments and touches no Pygame state, so it can run on any worker.
+    
+    Args:
+        positions_per_image (List[np.ndarray]): One (N, 2) array of (x, y) gaze positions
+            in pixels per image.
+        width (int): Width of the display in pixels.
+        height (int): Height of the display in pixels.
+        grid_size (int): Size of one grid cell in pixels.
+        sigma (float): Standard deviation of the Gaussian in pixels.
+        histogram_min_points (int): Number of points from which the density is estimated
+            by blurring a histogram instead of adding one Gaussian per point.
+    
+    Returns:
+        np.ndarray: (M, rows, cols) uint8 array holding the normalized density map of each
+            image; images without gaze points get an all-zero map.
+    """
+    from scipy.ndimage import gaussian_filter
+
+    # Initialize one 2D grid per image representing the display area divided by grid_size;
+    # single precision throughout, as the result is quantized to 8 bits anyway
+    rows, cols = height // grid_size, width // grid_size
+    grids = np.zeros((len(positions_per_image), rows, cols), dtype=np.float32)
+    # The Gaussian's standard deviation in grid cells, with an additional smoothing of two
+    # cells folded in: two Gaussian blurs in a row equal one with the summed variances
+    cell_sigma = np.float32(math.hypot(sigma / grid_size, 2.0))
+    # Images whose grid holds point counts that still need to be blurred
+    binned = []
+
+    for index, (grid, positions) in enumerate(zip(grids, positions_per_image)):
+        if not len(positions):
+            continue  # Nothing to accumulate for this image
+
+        # Gaze positions in grid cells
+        px = positions[:, 0].astype(np.float32) / np.float32(grid_size)
+        py = positions[:, 1].astype(np.float32) / np.float32(grid_size)
+
+        if len(positions) >= histogram_min_points:
+            # Count the points per grid cell; the counts are convolved with the Gaussian
+            # below, whose cost does not grow with the number of points
+            grid[...], _, _ = np.histogram2d(
+                py, px, bins=[rows, cols], range=[[0, rows], [0, cols]]
+            )
+            binned.append(index)
+        elif _splat_heatmap is not None:
+            # Accumulate truncated Gaussians with the compiled kernel
+            _splat_heatmap(px, py, cell_sigma, grid)
+        else:
+            # Add the precomputed truncated Gaussian into a local tile around each point,
+            # clipped to the grid; points are snapped to the nearest cell
+            stamp = _gaussian_stamp(float(cell_sigma))
+            r = stamp.shape[0] // 2
+            for gx, gy in zip(np.rint(px).astype(np.intp).tolist(),
+                              np.rint(py).astype(np.intp).tolist()):
+                y0, y1 = max(0, gy - r), min(rows, gy + r + 1)
+                x0, x1 = max(0, gx - r), min(cols, gx + r + 1)
+                if y0 < y1 and x0 < x1:
+                    grid[y0:y1, x0:x1] += stamp[y0 - gy + r:y1 - gy + r, x0 - gx + r:x1 - gx + r]
+
+    if binned:
+        # Convolve all histograms with the Gaussian at once (sigma 0 leaves the image axis
+        # alone); mode='constant' matches the unreflected sum of per-point Gaussians
+        grids[binned] = gaussian_filter(
+            grids[binned], sigma=(0, cell_sigma, cell_sigma), mode='constant'
+        )
+
+    # Normalize each grid straight to the 0-255 range of the stored 8-bit levels
+    peaks = grids.max(axis=(1, 2))
+    scales = np.divide(np.float32(255.0), peaks, out=np.zeros_like(peaks), where=peaks > 0)
+    grids *= scales[:, None, None]
+
+    # Quantize once here so storage and every later color lookup work on 8-bit levels
+    np.rint(grids, out=grids)
+    return grids.astype(np.uint8)
+
+
 @dataclass
 class GazePoint:
     """
@@ -44,16 +208,35 @@ class ImageHeatmapData:
         image_path (str): File path to the image.
         image_surface (pygame.Surface): The scaled Pygame surface of the image.
         image_rect (pygame.Rect): The rectangle defining the image's position and size on the screen.
-        gaze_points (List[GazePoint]): List of gaze points associated with the image.
-        density_map (Optional[np.ndarray]): 2D array representing the density of gaze points.
-        heatmap_surface (Optional[pygame.Surface]): Pygame surface representing the rendered heatmap.
+        positions_xy (np.ndarray): (N, 2) int32 array of the gaze positions associated with
+            the image.
+        timestamps (np.ndarray): (N,) float64 array of the gaze timestamps.
+        velocities (np.ndarray): (N,) float32 array of the gaze velocities.
+        density_map (Optional[np.ndarray]): 2D uint8 array representing the density of gaze
+            points, quantized from [0.0, 1.0] to [0, 255].
     """
     image_path: str
     image_surface: pygame.Surface
     image_rect: pygame.Rect
-    gaze_points: List[GazePoint]
+    positions_xy: np.ndarray
+    timestamps: np.ndarray
+    velocities: np.ndarray
     density_map: Optional[np.ndarray] = None
-    heatmap_surface: Optional[pygame.Surface] = None
+
+    @property
+    def gaze_points(self) -> List[GazePoint]:
+        """
+        The image's gaze points as GazePoint instances, built from the arrays on each access.
+        
+        Returns:
+            List[GazePoint]: One GazePoint per row of positions_xy, in the same order.
+        """
+        return [
+            GazePoint(timestamp=t, position=(x, y), velocity=v)
+            for (x, y), t, v in zip(
+                self.positions_xy.tolist(), self.timestamps.tolist(), self.velocities.tolist()
+            )
+        ]
 
 
 class ImageAnalysisView(BaseView):
@@ -86,10 +269,39 @@ class ImageAnalysisView(BaseView):
         # Heatmap generation settings
         self.GRID_SIZE = 2       # Each cell in the grid corresponds to 2x2 pixels
         self.SIGMA = 50.0        # Standard deviation for Gaussian smoothing
+        # From this many gaze points on, the density is estimated by binning the points and
+        # blurring the histogram once, whose cost does not grow with the number of points
+        self.HISTOGRAM_MIN_POINTS = 800
+        # Number of batches the images are split into, one per worker thread
+        self.HEATMAP_BATCHES = 4
+
+        # Intensity-to-RGBA lookup table backing _intensity_to_color
+        self._color_lut = self._build_color_lut(1024)
+        # Pixel bytes for every quantized density level, in the BGRA order of the heatmap
+        # surfaces; levels at or below 1% stay transparent
+        levels = np.arange(256) / 255.0
+        level_colors = self._color_lut[(levels * (len(self._color_lut) - 1)).astype(np.intp)]
+        level_colors[:int(0.01 * 255) + 1, 3] = 0
+        self._level_pixels = np.ascontiguousarray(level_colors[:, [2, 1, 0, 3]])
 
         # ThreadPoolExecutor for generating heatmaps in background threads
-        self.thread_pool: Optional[ThreadPoolExecutor] = ThreadPoolExecutor(max_workers=4)
-        self.thread_lock = threading.Lock()  # Lock to manage access to shared resources
+        self.thread_pool: Optional[ThreadPoolExecutor] = ThreadPoolExecutor(
+            max_workers=self.HEATMAP_BATCHES
+        )
+        # Submitted heatmap batches (image indices and their computation), in submission
+        # order, whose results are not stored yet
+        self._pending: List[Tuple[List[int], Future]] = []
+
+        # Shared surface showing the current image's heatmap; it takes its pixel format from
+        # a BGRA buffer surface so the wrapped density pixels scale into it as a plain copy.
+        # _displayed_heatmap is the image index rendered into it
+        cols, rows = self.width // self.GRID_SIZE, self.height // self.GRID_SIZE
+        self._display_heatmap_surface = pygame.Surface(
+            (cols * self.GRID_SIZE, rows * self.GRID_SIZE),
+            pygame.SRCALPHA,
+            pygame.image.frombuffer(bytes(4), (1, 1), 'BGRA')
+        )
+        self._displayed_heatmap: Optional[int] = None
 
         # Navigation and data tracking
         self.current_image_index = 0  # Index of the currently displayed image
@@ -99,11 +311,19 @@ class ImageAnalysisView(BaseView):
         self.total_generations = 0      # Total number of heatmaps to generate
         self.completed_generations = 0  # Number of heatmaps generated so far
 
+        # Rendered legend, built on first draw
+        self._legend_surface: Optional[pygame.Surface] = None
+        # Last navigation info text and its rendered surface
+        self._nav_info: Optional[Tuple[str, pygame.Surface]] = None
+
         # Navigation hint display settings
         self.show_navigation_hint = True  # Flag to show/hide navigation hints
         self.HINT_DURATION = 3000         # Duration to display navigation hint (in milliseconds)
         self.hint_start_time: Optional[float] = None  # Timestamp when hint was first shown
 
+        # Whether the screen content changed since the last drawn frame
+        self._dirty = True
+
     # -------------------------------------------------------------------------
     # LOAD & DATA PREPARATION
     # -------------------------------------------------------------------------
@@ -116,9 +336,10 @@ class ImageAnalysisView(BaseView):
         Load and prepare images along with their corresponding gaze points.
         
         This method processes each image by loading it, scaling it to fit the display,
-        and associating it with its corresponding gaze points. Gaze points are converted
-        into GazePoint instances with stub values for timestamp and velocity, as only
-        positions are provided at this stage.
+        and associating it with its corresponding gaze points. Gaze points are stored
+        column-wise in NumPy arrays, which is what the heatmap computation works on, with
+        stub values for timestamp and velocity, as only positions are provided at this
+        stage. GazePoint instances are only built when gaze_points is accessed.
         
         Args:
             image_paths (List[str]): List of file paths to the images.
@@ -130,21 +351,28 @@ class ImageAnalysisView(BaseView):
 
         # Iterate over each image path and its corresponding gaze points
         for path, raw_points in zip(image_paths, gaze_data_per_image):
-            # Create GazePoint instances with timestamp=0 and velocity=0
-            gaze_points = [
-                GazePoint(timestamp=0, position=(x, y), velocity=0) 
-                for (x, y) in raw_points
-            ]
+            # Store the points column-wise, with timestamp=0 and velocity=0
+            positions_xy = np.asarray(raw_points, dtype=np.int32).reshape(-1, 2)
+            timestamps = np.zeros(len(positions_xy), dtype=np.float64)
+            velocities = np.zeros(len(positions_xy), dtype=np.float32)
 
-            # Load the image from the file system
+            # Load the image from the file system and convert it to the display's pixel format
+            # once, so it is not converted again on every blit; alpha is kept if present
             original = pygame.image.load(path)
+            if original.get_flags() & pygame.SRCALPHA:
+                original = original.convert_alpha()
+            else:
+                original = original.convert()
             img_w, img_h = original.get_width(), original.get_height()
             # Calculate scaling factor to fit the image within the display dimensions
             scale = min(self.width / img_w, self.height / img_h)
             new_w = int(img_w * scale)
             new_h = int(img_h * scale)
-            # Smoothly scale the image to the new dimensions
-            scaled_image = pygame.transform.smoothscale(original, (new_w, new_h))
+            # Smoothly scale the image to the new dimensions, unless it already has them
+            if (new_w, new_h) == (img_w, img_h):
+                scaled_image = original
+            else:
+                scaled_image = pygame.transform.smoothscale(original, (new_w, new_h))
             
             # Center the image on the screen
             x = (self.width - new_w) // 2
@@ -156,13 +384,16 @@ class ImageAnalysisView(BaseView):
                 image_path=path,
                 image_surface=scaled_image,
                 image_rect=image_rect,
-                gaze_points=gaze_points
+                positions_xy=positions_xy,
+                timestamps=timestamps,
+                velocities=velocities
             ))
 
         # Reset navigation and hint display settings
         self.current_image_index = 0
         self.show_navigation_hint = True
         self.hint_start_time = pygame.time.get_ticks()  # Record the start time for the hint
+        self._dirty = True
 
     # -------------------------------------------------------------------------
     # HEATMAP GENERATION
@@ -173,8 +404,11 @@ class ImageAnalysisView(BaseView):
         
         This method checks if heatmap generation is already in progress or if there are
         no images to process. If the ThreadPoolExecutor has been shut down, it is
-        re-initialized. Heatmap generation tasks are submitted to the executor for each
-        image.
+        re-initialized. The images are queued by their distance from the current image:
+        the current image is submitted on its own, then its neighbours, and the remaining
+        images are split into one batch per worker thread, each batch's density maps being
+        computed together as a single tensor. The loading screen is only shown until the
+        current image's heatmap is ready; the rest keep generating in the background.
         """
         # Skip if generation is already in progress or there are no images to process
         if self.is_generating or not self.image_data:
@@ -182,79 +416,140 @@ class ImageAnalysisView(BaseView):
 
         # Re-initialize the ThreadPoolExecutor if it has been shut down
         if self.thread_pool is None:
-            self.thread_pool = ThreadPoolExecutor(max_workers=4)
+            self.thread_pool = ThreadPoolExecutor(max_workers=self.HEATMAP_BATCHES)
 
         # Set generation flags and counters
         self.is_generating = True
         self.generation_progress = 0.0
         self.total_generations = len(self.image_data)
         self.completed_generations = 0
+        self._displayed_heatmap = None
+
+        # Queue the images nearest to the current one first; the executor runs the
+        # submitted computations in order
+        order = sorted(
+            range(len(self.image_data)),
+            key=lambda i: abs(i - self.current_image_index)
+        )
+        batches = [order[:1], order[1:3]] + [
+            batch.tolist() for batch in np.array_split(order[3:], self.HEATMAP_BATCHES)
+        ]
+        self._pending = [
+            (batch, self._submit_heatmaps(batch)) for batch in batches if len(batch)
+        ]
 
-        # Submit a heatmap generation task for each image
-        for i in range(len(self.image_data)):
-            self.thread_pool.submit(self._generate_heatmap, i)
+    def _submit_heatmaps(self, image_indices: List[int]) -> Future:
+        """
+        Submit one batched density computation for the given images to the executor.
+        
+        Args:
+            image_indices (List[int]): Indices of the images to compute density maps for.
+        
+        Returns:
+            Future: The computation, resulting in one density map per image.
+        """
+        return self.thread_pool.submit(
+            _gen_heatmap_worker,
+            [self.image_data[i].positions_xy for i in image_indices],
+            self.width,
+            self.height,
+            self.GRID_SIZE,
+            self.SIGMA,
+            self.HISTOGRAM_MIN_POINTS
+        )
 
-    def _generate_heatmap(self, image_index: int) -> None:
+    def _collect_finished_heatmaps(self) -> None:
         """
-        Generate a heatmap for a single image in a background thread.
+        Store the density maps of all finished heatmap computations.
         
-        This method processes the gaze points for the specified image to create a density map
-        using Gaussian distribution. The density map is then smoothed and rendered to a Pygame
-        surface for visualization.
+        Called once per frame while generation is in progress, so the loading screen keeps
+        updating while the worker threads compute the remaining density maps. Surfaces are
+        only rendered for the heatmap on display, see _render_heatmap_surface.
+        """
+        still_pending = []
+        for image_indices, future in self._pending:
+            if not future.done():
+                still_pending.append((image_indices, future))
+                continue
+
+            try:
+                self._store_heatmaps(image_indices, future.result())
+            except Exception as e:
+                # Log any errors that occur during heatmap generation
+                print(f"Error generating heatmaps for images {image_indices}: {e}")
+                self._store_heatmaps(image_indices, [])
+        self._pending = still_pending
+
+    def _store_heatmaps(self, image_indices: List[int], density_maps: np.ndarray) -> None:
+        """
+        Store computed density maps and count the images as generated.
         
         Args:
-            image_index (int): The index of the image in the image_data list for which the
-                heatmap is to be generated.
+            image_indices (List[int]): Indices of the images the maps belong to.
+            density_maps (np.ndarray): One density map per image, in the same order; empty
+                if the computation failed.
         """
-        try:
-            # Retrieve the ImageHeatmapData for the specified image
+        for image_index, density_map in zip(image_indices, density_maps):
             data = self.image_data[image_index]
-            # Extract all gaze positions for the image
-            positions = [p.position for p in data.gaze_points]
-            if not positions:
-                # If there are no gaze points, increment completion counter and update progress
-                with self.thread_lock:
-                    self.completed_generations += 1
-                    self._update_progress()
-                return
-
-            # Initialize a 2D grid representing the display area divided by GRID_SIZE
-            grid = np.zeros((self.height // self.GRID_SIZE,
-                             self.width // self.GRID_SIZE))
-
-            # Create meshgrid indices for vectorized operations
-            y_indices, x_indices = np.mgrid[0:grid.shape[0], 0:grid.shape[1]]
-
-            # Accumulate Gaussian contributions from each gaze point
-            for (x, y) in positions:
-                grid_x = x / self.GRID_SIZE
-                grid_y = y / self.GRID_SIZE
-                # Calculate Gaussian value based on distance from the gaze point
-                gaussian = np.exp(
-                    -((x_indices - grid_x)**2 + (y_indices - grid_y)**2)
-                    / (2.0 * (self.SIGMA / self.GRID_SIZE)**2)
-                )
-                grid += gaussian
-
-            # Normalize the grid to ensure values are between 0 and 1
-            if grid.max() > 0:
-                grid /= grid.max()
+            # Images without gaze points keep no heatmap
+            data.density_map = density_map if len(data.positions_xy) else None
 
-            # Apply an additional Gaussian filter for smoother density distribution
-            from scipy.ndimage import gaussian_filter
-            data.density_map = gaussian_filter(grid, sigma=2.0)
+        # Update the generation progress, counting every image of the batch
+        self.completed_generations += len(image_indices)
+        self._update_progress()
 
-            # Render the density map to a Pygame surface
-            self._render_heatmap_surface(image_index)
+        # Redraw if the heatmap for the image on display arrived
+        if self.current_image_index in image_indices:
+            self._dirty = True
 
-            # Update the generation progress
-            with self.thread_lock:
-                self.completed_generations += 1
-                self._update_progress()
+    def _prioritize_heatmap(self, image_index: int) -> None:
+        """
+        Make sure the heatmap for an image the user navigated to is generated next.
+        
+        If the image's batch has not been started by a worker yet, it is taken off the
+        queue: the image's density map is computed right away on the calling thread, and
+        the other images of the batch are queued again.
+        
+        Args:
+            image_index (int): Index of the image that is about to be shown.
+        """
+        for position, (image_indices, future) in enumerate(self._pending):
+            if image_index not in image_indices:
+                continue
+            if not future.cancel():
+                return  # Already running or done; draw() shows the loading screen meanwhile
+
+            others = [i for i in image_indices if i != image_index]
+            del self._pending[position]
+            if others:
+                self._pending.append((others, self._submit_heatmaps(others)))
+            try:
+                density_maps = _gen_heatmap_worker(
+                    [self.image_data[image_index].positions_xy],
+                    self.width,
+                    self.height,
+                    self.GRID_SIZE,
+                    self.SIGMA,
+                    self.HISTOGRAM_MIN_POINTS
+                )
+            except Exception as e:
+                # Log any errors that occur during heatmap generation
+                print(f"Error generating heatmap for image {image_index}: {e}")
+                density_maps = []
+            self._store_heatmaps([image_index], density_maps)
+            return
 
-        except Exception as e:
-            # Log any errors that occur during heatmap generation
-            print(f"Error generating heatmap for image {image_index}: {e}")
+    def _is_heatmap_pending(self, image_index: int) -> bool:
+        """
+        Check whether the heatmap for an image is still being generated.
+        
+        Args:
+            image_index (int): Index of the image to check.
+        
+        Returns:
+            bool: True if the image's density map has not been computed yet.
+        """
+        return any(image_index in image_indices for image_indices, _ in self._pending)
 
     def _update_progress(self) -> None:
         """
@@ -269,37 +564,32 @@ class ImageAnalysisView(BaseView):
         if self.completed_generations == self.total_generations:
             self.is_generating = False  # All heatmaps have been generated
 
-    def _render_heatmap_surface(self, image_index: int) -> None:
+    def _render_heatmap_surface(self, density_map: np.ndarray) -> None:
         """
-        Render the final density map to a colored Pygame surface.
+        Render a density map into the shared display heatmap surface.
         
-        This method converts the normalized density map into a visual heatmap by mapping
-        intensity values to colors and drawing them onto a Pygame surface.
+        Only one heatmap is visible at a time, so a single surface is reused for all images
+        and re-rendered from the stored density map when another image is shown. The
+        quantized density map is converted into pixels by looking up every grid cell in the
+        precomputed level table. The resulting buffer is wrapped as a surface with one pixel
+        per grid cell without copying it, and scaled up by GRID_SIZE straight into the
+        display surface.
         
         Args:
-            image_index (int): The index of the image in the image_data list for which the
-                heatmap is to be rendered.
-        """
-        data = self.image_data[image_index]
-        if data.density_map is None:
-            return  # No density map to render
-
-        # Create a transparent surface for the heatmap
-        surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        rows, cols = data.density_map.shape
-        for y in range(rows):
-            for x in range(cols):
-                val = data.density_map[y, x]
-                if val > 0.01:  # Skip very low values to reduce overdraw and improve performance
-                    color = self._intensity_to_color(val)
-                    # Create a small surface for each grid cell to represent intensity
-                    rect = pygame.Surface((self.GRID_SIZE, self.GRID_SIZE), pygame.SRCALPHA)
-                    rect.fill(color)
-                    # Blit the colored rectangle onto the heatmap surface at the appropriate position
-                    surface.blit(rect, (x * self.GRID_SIZE, y * self.GRID_SIZE))
-
-        # Assign the rendered heatmap surface to the corresponding ImageHeatmapData
-        data.heatmap_surface = surface
+            density_map (np.ndarray): The uint8 density map to render.
+        """
+        # Map each cell to its BGRA pixel; fancy indexing yields a C-contiguous buffer
+        pixels = self._level_pixels[density_map]
+        rows, cols = density_map.shape
+
+        # Wrap the buffer as a grid-resolution surface, then let nearest-neighbour scaling
+        # expand every cell to GRID_SIZE x GRID_SIZE pixels
+        cells = pygame.image.frombuffer(pixels, (cols, rows), 'BGRA')
+        pygame.transform.scale(
+            cells,
+            self._display_heatmap_surface.get_size(),
+            self._display_heatmap_surface
+        )
 
     # -------------------------------------------------------------------------
     # DRAWING
@@ -308,14 +598,32 @@ class ImageAnalysisView(BaseView):
         """
         Main draw method for the ImageAnalysisView.
         
-        Displays a loading screen if heatmap generation is in progress. Otherwise, it shows
-        the current image along with its corresponding heatmap. Additionally, it overlays
-        navigation information and a color legend for interpreting heatmap intensities.
+        Displays a loading screen while the current image's heatmap is being generated.
+        Otherwise, it shows the current image along with its corresponding heatmap.
+        Additionally, it overlays navigation information and a color legend for interpreting
+        heatmap intensities. The screen only changes on navigation, when a heatmap arrives
+        and when the hint is hidden, so frames are only drawn while the view is marked dirty.
         """
         if self.is_generating:
-            # Display the loading screen while heatmaps are being generated
-            self._draw_loading_screen()
+            # Collect heatmaps that finished in the background
+            self._collect_finished_heatmaps()
+            if self._is_heatmap_pending(self.current_image_index):
+                # Display the loading screen until the current heatmap is ready, then redraw
+                self._draw_loading_screen()
+                self._dirty = True
+                return
+
+        # Hide the navigation hint once it has been displayed long enough
+        if self.show_navigation_hint and self.hint_start_time:
+            elapsed = pygame.time.get_ticks() - self.hint_start_time
+            if elapsed > self.HINT_DURATION:
+                self.show_navigation_hint = False
+                self._dirty = True
+
+        # Nothing changed since the last frame, which is still on the display
+        if not self._dirty:
             return
+        self._dirty = False
 
         # If there are no images loaded, simply fill the screen with the background color
         if not self.image_data:
@@ -331,9 +639,13 @@ class ImageAnalysisView(BaseView):
         # Draw the image onto the screen at its designated rectangle
         self.screen.blit(current_data.image_surface, current_data.image_rect)
 
-        # Overlay the heatmap if it has been generated
-        if current_data.heatmap_surface:
-            self.screen.blit(current_data.heatmap_surface, (0, 0))
+        # Overlay the heatmap if it has been generated, rendering it first if another
+        # image's heatmap is currently in the shared surface
+        if current_data.density_map is not None:
+            if self._displayed_heatmap != self.current_image_index:
+                self._render_heatmap_surface(current_data.density_map)
+                self._displayed_heatmap = self.current_image_index
+            self.screen.blit(self._display_heatmap_surface, (0, 0))
 
         # Overlay navigation information and heatmap legend
         self._draw_navigation_info()
@@ -390,25 +702,19 @@ class ImageAnalysisView(BaseView):
         Display the current image index out of the total number of images.
         
         This information is shown at the top-left corner of the screen to inform the user
-        which heatmap is currently being viewed.
+        which heatmap is currently being viewed. The text is only re-rendered when it changes.
         """
         info_text = f"Image {self.current_image_index + 1} of {len(self.image_data)}"
-        text_surf = self.FONT.render(info_text, True, self.TEXT_COLOR)
-        self.screen.blit(text_surf, (20, 20))  # Position at (20, 20) pixels
+        if self._nav_info is None or self._nav_info[0] != info_text:
+            self._nav_info = (info_text, self.FONT.render(info_text, True, self.TEXT_COLOR))
+        self.screen.blit(self._nav_info[1], (20, 20))  # Position at (20, 20) pixels
 
     def _draw_navigation_hint(self) -> None:
         """
         Display a temporary hint about using the arrow keys for navigation at the bottom of the screen.
         
-        The hint is shown for a predefined duration (HINT_DURATION) and then hidden.
+        The hint is shown for a predefined duration (HINT_DURATION) and then hidden by draw().
         """
-        # Check if the hint has been displayed long enough to be hidden
-        if self.hint_start_time:
-            elapsed = pygame.time.get_ticks() - self.hint_start_time
-            if elapsed > self.HINT_DURATION:
-                self.show_navigation_hint = False  # Hide the hint after the duration
-                return
-
         # Define the hint text
         hint_text = "Use LEFT/RIGHT arrow keys to navigate between heatmaps"
         # Render the hint text
@@ -422,7 +728,8 @@ class ImageAnalysisView(BaseView):
         Draw a color scale legend for the heatmap intensity in the bottom-right corner.
         
         The legend provides a visual guide to interpret the color gradient used in the heatmaps,
-        indicating the relationship between color intensity and gaze density.
+        indicating the relationship between color intensity and gaze density. It never
+        changes, so it is rendered off-screen once and blitted on every later frame.
         """
         # Define dimensions and positioning for the legend
         legend_w = 160
@@ -430,18 +737,37 @@ class ImageAnalysisView(BaseView):
         margin = 20
         x = self.width - legend_w - margin
         y = self.height - legend_h - margin
-        rect = pygame.Rect(x, y, legend_w, legend_h)
+
+        if self._legend_surface is None:
+            self._legend_surface = self._render_legend(legend_w, legend_h)
+        self.screen.blit(self._legend_surface, (x, y))
+
+    def _render_legend(self, legend_w: int, legend_h: int) -> pygame.Surface:
+        """
+        Render the complete legend (background, border, title, gradient and labels) into
+        an off-screen surface.
+        
+        Args:
+            legend_w (int): Width of the legend in pixels.
+            legend_h (int): Height of the legend in pixels.
+        
+        Returns:
+            pygame.Surface: The rendered legend.
+        """
+        # The background fills the whole legend, so the surface needs no alpha channel
+        legend = pygame.Surface((legend_w, legend_h)).convert()
+        rect = legend.get_rect()
 
         # Draw the background rectangle for the legend
-        pygame.draw.rect(self.screen, (30, 30, 50), rect)
+        pygame.draw.rect(legend, (30, 30, 50), rect)
         # Draw the border of the legend rectangle
-        pygame.draw.rect(self.screen, self.GRID_COLOR, rect, 1)
+        pygame.draw.rect(legend, self.GRID_COLOR, rect, 1)
 
         # Render and center the legend title
         label = self.FONT.render("Gaze Intensity", True, self.TEXT_COLOR)
         lx = rect.centerx - (label.get_width() // 2)
         ly = rect.top + 5
-        self.screen.blit(label, (lx, ly))
+        legend.blit(label, (lx, ly))
 
         # Define the gradient area within the legend
         grad_left = rect.left + 10
@@ -451,23 +777,34 @@ class ImageAnalysisView(BaseView):
         grad_width = grad_right - grad_left
 
         if grad_width <= 0:
-            return  # Exit if the gradient width is invalid
+            return legend  # Skip the gradient if its width is invalid
 
-        # Draw the gradient color scale by mapping intensity to color
-        for i in range(grad_width):
-            ratio = i / float(grad_width)
-            color = self._intensity_to_color(ratio)
-            pygame.draw.line(self.screen, color,
-                             (grad_left + i, grad_top),
-                             (grad_left + i, grad_bottom))
+        # Draw the gradient color scale by mapping intensity to color, one column per pixel
+        grad_size = (grad_width, grad_bottom - grad_top + 1)
+        ratios = np.arange(grad_width, dtype=np.float32) / np.float32(grad_width)
+        colors = self._color_lut[(ratios * (len(self._color_lut) - 1)).astype(np.int32), :3]
+        # Row-major RGB pixels for frombuffer, which keeps a reference to the bytes
+        rows = np.broadcast_to(colors[None, :, :], (grad_size[1], grad_width, 3))
+        gradient = pygame.image.frombuffer(rows.tobytes(), grad_size, 'RGB')
+        legend.blit(gradient, (grad_left, grad_top))
 
         # Render "Low" and "High" labels within the legend area
         low_surf = self.FONT.render("Low", True, self.TEXT_COLOR)
         high_surf = self.FONT.render("High", True, self.TEXT_COLOR)
 
         # Position labels inside the legend to prevent them from being cut off
-        self.screen.blit(low_surf, (grad_left, grad_bottom + 5))
-        self.screen.blit(high_surf, (grad_right - high_surf.get_width(), grad_bottom + 5))
+        legend.blit(low_surf, (grad_left, grad_bottom + 5))
+        legend.blit(high_surf, (grad_right - high_surf.get_width(), grad_bottom + 5))
+        return legend
+
+    def invalidate(self) -> None:
+        """
+        Force the next draw() call to redraw the whole view.
+        
+        Frames whose content did not change are skipped; call this when the screen content
+        was lost from outside the view, e.g. after the window was uncovered.
+        """
+        self._dirty = True
 
     # -------------------------------------------------------------------------
     # HANDLE INPUT
@@ -482,6 +819,7 @@ class ImageAnalysisView(BaseView):
             event (pygame.event.Event): The event to handle.
         """
         if event.type == pygame.KEYDOWN:
+            previous_index = self.current_image_index
             if event.key == pygame.K_LEFT:
                 # Navigate to the previous heatmap, ensuring the index doesn't go below 0
                 self.current_image_index = max(0, self.current_image_index - 1)
@@ -491,16 +829,55 @@ class ImageAnalysisView(BaseView):
                     len(self.image_data) - 1,
                     self.current_image_index + 1
                 )
+            # Redraw on the next frame if another heatmap is shown, generating it first if
+            # it is still queued
+            if self.current_image_index != previous_index:
+                self._prioritize_heatmap(self.current_image_index)
+                self._dirty = True
 
     # -------------------------------------------------------------------------
     # COLOR MAPPING
     # -------------------------------------------------------------------------
+    def _build_color_lut(self, size: int) -> np.ndarray:
+        """
+        Build a lookup table for the blue-to-red gradient used by the heatmaps.
+        
+        Entry i holds the RGBA color for intensity i / (size - 1). The gradient runs from
+        blue (low intensity) to red (high intensity), passing through cyan, green, and
+        yellow; alpha grows with intensity and reaches full opacity at two thirds.
+        
+        Args:
+            size (int): Number of entries in the table.
+        
+        Returns:
+            np.ndarray: A (size, 4) uint8 array of RGBA colors.
+        """
+        t = np.linspace(0.0, 1.0, size)
+        # Define color stops for the gradient
+        stops = [0.0, 0.25, 0.5, 0.75, 1.0]
+        colors = np.array([
+            (0, 0, 255),    # Blue
+            (0, 255, 255),  # Cyan
+            (0, 255, 0),    # Green
+            (255, 255, 0),  # Yellow
+            (255, 0, 0)     # Red
+        ], dtype=np.float64)
+
+        lut = np.empty((size, 4), dtype=np.uint8)
+        # Linearly interpolate each RGB component between the stops (truncated like int())
+        for channel in range(3):
+            lut[:, channel] = np.interp(t, stops, colors[:, channel])
+        # Adjust alpha based on intensity, capping at full opacity
+        lut[:, 3] = 255 * np.minimum(1.0, t * 1.5)
+        return lut
+
     def _intensity_to_color(self, intensity: float) -> Tuple[int, int, int, int]:
         """
         Convert a normalized intensity value to a color on a blue-to-red gradient.
         
         This method maps intensity values between 0.0 and 1.0 to a gradient ranging from
         blue (low intensity) to red (high intensity), passing through cyan, green, and yellow.
+        The color is looked up in the table built by _build_color_lut.
         
         Args:
             intensity (float): A normalized value between 0.0 and 1.0 representing intensity.
@@ -510,30 +887,7 @@ class ImageAnalysisView(BaseView):
         """
         # Clamp intensity to the [0.0, 1.0] range
         intensity = max(0.0, min(1.0, intensity))
-        # Define color stops for the gradient
-        colors = [
-            (0, (0, 0, 255)),       # Blue
-            (0.25, (0, 255, 255)),  # Cyan
-            (0.5, (0, 255, 0)),     # Green
-            (0.75, (255, 255, 0)),  # Yellow
-            (1, (255, 0, 0))        # Red
-        ]
-        # Iterate through the color stops to find the appropriate segment for interpolation
-        for i in range(len(colors) - 1):
-            if intensity <= colors[i + 1][0]:
-                # Calculate the interpolation factor within the current segment
-                t = (intensity - colors[i][0]) / (colors[i + 1][0] - colors[i][0])
-                c1 = colors[i][1]
-                c2 = colors[i + 1][1]
-                # Linearly interpolate each RGB component
-                r = int(c1[0] + t * (c2[0] - c1[0]))
-                g = int(c1[1] + t * (c2[1] - c1[1]))
-                b = int(c1[2] + t * (c2[2] - c1[2]))
-                # Adjust alpha based on intensity, capping at full opacity
-                alpha = int(255 * min(1.0, intensity * 1.5))
-                return (r, g, b, alpha)
-        # Fallback color if intensity exceeds all defined stops (should not occur due to clamping)
-        return (255, 0, 0, 255)
+        return tuple(self._color_lut[int(intensity * (len(self._color_lut) - 1))].tolist())
 
     # -------------------------------------------------------------------------
     # CLEANUP
@@ -542,13 +896,17 @@ class ImageAnalysisView(BaseView):
         """
         Terminate any ongoing heatmap generation and clear all image data.
         
-        If the ThreadPoolExecutor is active, it is shut down gracefully, waiting for all
-        submitted tasks to complete. The image_data list is then cleared to free resources.
+        If the ThreadPoolExecutor is active, it is shut down gracefully: batches that are
+        still queued are cancelled, and only the ones already running are waited for. The
+        image_data list is then cleared to free resources.
         """
         if self.thread_pool:
-            # Shut down the ThreadPoolExecutor, waiting for all heatmaps to finish generating
-            self.thread_pool.shutdown(wait=True)
+            # Shut down the ThreadPoolExecutor, cancelling queued batches and waiting for the
+            # running ones to finish
+            self.thread_pool.shutdown(wait=True, cancel_futures=True)
             self.thread_pool = None  # Set to None to allow re-initialization if needed
+        self._pending.clear()
+        self._displayed_heatmap = None
 
         # Clear all image data to free memory
         self.image_data.clear()
@@ -566,3 +924,4 @@ class ImageAnalysisView(BaseView):
         self.generation_progress = 0.0
         self.total_generations = 0
         self.completed_generations = 0
+        self._dirty = True
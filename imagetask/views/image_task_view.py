@@ -6,14 +6,74 @@
 # sequence logic, displays gaze overlays, and ensures smooth transitions between images.
 # =========================================================================================
 
+import functools
+import itertools
 import time
-from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Deque, List, Optional, Tuple
+from typing import Deque, Dict, List, Optional, Tuple
+import numpy as np
 import pygame
 from .base_view import BaseView
 
 
+@functools.lru_cache(maxsize=16)
+def _load_scaled(
+    image_path: str,
+    width: int,
+    height: int,
+    smooth: bool = True
+) -> Tuple[pygame.Surface, Tuple[int, int, int, int]]:
+    """
+    Load an image from file and scale it to fit a display of the given size.
+    
+    The image is scaled to fit within the display dimensions while maintaining its aspect
+    ratio, and centered. Results are cached per path, display size and scaling mode, so
+    showing the sequence again after a reset does not read and resample the files again.
+    The returned surface is shared and must not be modified.
+    
+    Args:
+        image_path (str): File path to the image.
+        width (int): Width of the display in pixels.
+        height (int): Height of the display in pixels.
+        smooth (bool, optional): Whether to scale with smoothscale's filtering instead of
+            the faster nearest-neighbour scale. Defaults to True.
+    
+    Returns:
+        Tuple[pygame.Surface, Tuple[int, int, int, int]]: The scaled image and its
+            (x, y, width, height) rectangle on the display.
+    
+    Raises:
+        pygame.error: If the image cannot be loaded.
+    """
+    # Load the image from the specified file path and convert it to the display's pixel
+    # format once, so it is not converted again on every blit; alpha is kept if present
+    original = pygame.image.load(image_path)
+    if original.get_flags() & pygame.SRCALPHA:
+        original = original.convert_alpha()
+    else:
+        original = original.convert()
+    img_width = original.get_width()
+    img_height = original.get_height()
+
+    # Calculate scaling factor to fit the image within the display while maintaining aspect ratio
+    width_ratio = width / img_width
+    height_ratio = height / img_height
+    scale_factor = min(width_ratio, height_ratio)
+
+    new_width = int(img_width * scale_factor)
+    new_height = int(img_height * scale_factor)
+
+    # Smoothly scale the image to the new dimensions
+    scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+    scaled = scale(original, (new_width, new_height))
+
+    # Center the image on the screen
+    x = (width - new_width) // 2
+    y = (height - new_height) // 2
+    return scaled, (x, y, new_width, new_height)
+
+
 class ImageTaskView(BaseView):
     """
     Handles the image task phase, displaying a sequence of images while tracking gaze,
@@ -41,24 +101,124 @@ class ImageTaskView(BaseView):
         self.TRAIL_LENGTH = 25              # Number of previous gaze points to display as a trail
         self.GAZE_COLOR = (64, 196, 255)    # Color of the gaze visualization (light blue)
         self.show_gaze_overlay: bool = True # Flag to toggle gaze overlay visibility
-        # Surface for drawing gaze visuals with per-pixel alpha for transparency
+        # Surface for drawing gaze visuals with per-pixel alpha for transparency. It is kept at
+        # full resolution: only the trail's bounding rect is cleared and blitted each frame
+        # (see clear_surface and blit_dirty) and the glow goes straight to the screen, so a
+        # half-size buffer would save little while blurring the 2 px trail lines
         self.gaze_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        # Glow drawn at the current gaze position, pre-rendered once, see _build_glow_sprites
+        self._glow_punch, self._glow_sprite = self._build_glow_sprites()
+        # Per-point trail styles keyed by the number of points in the trail, see _get_trail_styles
+        self._trail_styles: Dict[
+            int, List[Tuple[Optional[Tuple[pygame.Surface, pygame.Surface]], int, Tuple[int, ...]]]
+        ] = {}
+        # Prepare every trail length up to TRAIL_LENGTH now rather than on the first frames
+        for num_points in range(2, self.TRAIL_LENGTH + 1):
+            self._get_trail_styles(num_points)
 
         # Image sequence timing
-        self.IMAGE_DISPLAY_TIME = 2.0        # Duration to display each image (in seconds)
+        self.IMAGE_DISPLAY_TIME_MS = 2000    # Duration to display each image (in milliseconds)
+        self.SMOOTH_SCALING = True           # Filter images when scaling (False: nearest neighbour)
         self.image_paths: List[str] = []     # List of image file paths to display
         self.current_idx = 0                  # Index of the currently displayed image
         self.sequence_complete = False        # Flag indicating if the image sequence is complete
-        self.display_start_time: Optional[float] = None  # Timestamp when the current image started displaying
+        self.display_start_ms: Optional[int] = None  # pygame ticks when the current image started displaying
 
         # Current image properties
         self.current_image: Optional[pygame.Surface] = None  # Pygame surface of the current image
         self.image_rect: Optional[pygame.Rect] = None        # Rectangle defining the current image's position and size
 
+        # Background loading of the next image while the current one is on screen; holds the
+        # index of the image being prefetched and its load
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = ThreadPoolExecutor(max_workers=1)
+        self._prefetch: Optional[Tuple[int, Future]] = None
+
+        # What the last frame showed, see draw(); None forces the next frame to be drawn in full
+        self._last_draw_state: Optional[tuple] = None
+        # Screen areas covered by the gaze overlay and debug text in the last frame
+        self._overlay_rects: List[pygame.Rect] = []
+
+        # Wall clock second of the frame being drawn, read once per frame in draw()
+        self._frame_second = 0
+        # Clock text for the debug info, only formatted again when the second changes
+        self._clock_second: Optional[int] = None
+        self._clock_text = ""
+
         # Optional fade logic (currently unused but can be extended for fade transitions)
         self.fade_alpha = 255               # Alpha value for fade effect (255 = fully opaque)
         self.FADE_SPEED = 5                 # Speed at which the fade effect occurs (unused)
 
+    def _build_glow_sprites(self) -> Tuple[pygame.Surface, pygame.Surface]:
+        """
+        Pre-render the glow effect shown at the current gaze position.
+        
+        The glow consists of concentric anti-aliased circles from GAZE_RADIUS + 12 down
+        to GAZE_RADIUS - 11, each one overwriting the previous. The circles are drawn once
+        onto a transparent sprite. Blitting the outermost circle's punch sprite with
+        BLEND_RGBA_MULT and then the glow sprite with BLEND_RGBA_ADD yields the same pixels
+        as drawing all circles onto the target, with two blits instead of 24 circles.
+        
+        The glow sprite is returned with its color premultiplied by its alpha, so it can be
+        blended onto the screen with BLEND_PREMULTIPLIED, which skips the per-pixel
+        multiplication of the source color that a regular alpha blit performs.
+        
+        Returns:
+            Tuple[pygame.Surface, pygame.Surface]: The punch and glow sprites, both centered
+                on the gaze position when blitted at (x - R - 1, y - R - 1), where
+                R = GAZE_RADIUS + 12.
+        """
+        outer_radius = self.GAZE_RADIUS + 12
+        punch, _ = self._get_circle_sprites(outer_radius, (*self.GAZE_COLOR, 255))
+        glow = pygame.Surface(punch.get_size(), pygame.SRCALPHA, 32).convert_alpha()
+        glow.fill((0, 0, 0, 0))
+
+        # Stamp the circle sprites like draw_aa_circle does, but without registering the
+        # off-screen sprite in the dirty rect bookkeeping
+        red, green, blue = self.GAZE_COLOR
+        for radius in range(outer_radius, self.GAZE_RADIUS - 12, -1):
+            alpha = int(130 * (radius / self.GAZE_RADIUS))
+            circle_punch, circle = self._get_circle_sprites(radius, (red, green, blue, alpha))
+            pos = (outer_radius - radius, outer_radius - radius)
+            glow.blit(circle_punch, pos, special_flags=pygame.BLEND_RGBA_MULT)
+            glow.blit(circle, pos, special_flags=pygame.BLEND_RGBA_ADD)
+        return punch, glow.premul_alpha()
+
+    def _get_trail_styles(
+        self,
+        num_points: int
+    ) -> List[Tuple[Optional[Tuple[pygame.Surface, pygame.Surface]], int, Tuple[int, ...]]]:
+        """
+        Return how each point of a gaze trail with the given number of points is drawn.
+        
+        Older points are drawn smaller and more transparent. The circle sprites, sizes and
+        colors only depend on a point's position in the trail, so they are computed once per
+        trail length instead of on every frame.
+        
+        Args:
+            num_points (int): Number of points in the gaze history.
+        
+        Returns:
+            List[Tuple[Optional[Tuple[pygame.Surface, pygame.Surface]], int, Tuple[int, ...]]]:
+                For every point but the newest, the (punch, circle) sprites of its circle
+                (None if it is too small to be visible), the sprites' offset from the point
+                and the RGBA color of the circle and the line to the next point.
+        """
+        styles = self._trail_styles.get(num_points)
+        if styles is None:
+            # Calculate progress along the trail for dynamic effects, for all points at once
+            progress = np.arange(num_points - 1) / (num_points - 1)
+            alphas = (180 * progress).astype(int)  # Fade out the trail
+            sizes = (self.GAZE_RADIUS * 0.5 * (1 - progress)).astype(int)  # Decrease size for older points
+
+            styles = []
+            red, green, blue = self.GAZE_COLOR
+            for size, alpha in zip(sizes.tolist(), alphas.tolist()):
+                color = (red, green, blue, alpha)
+                sprites = self._get_circle_sprites(size, color) if size >= 1 else None
+                styles.append((sprites, size + 1, color))
+            self._trail_styles[num_points] = styles
+        return styles
+
     def set_images(self, image_paths: List[str]) -> None:
         """
         Initialize the image sequence with a list of file paths.
@@ -72,6 +232,7 @@ class ImageTaskView(BaseView):
         self.image_paths = image_paths
         self.current_idx = 0
         self.sequence_complete = False
+        self._last_draw_state = None
 
         if not self.image_paths:
             # No images provided; mark the sequence as complete
@@ -80,7 +241,7 @@ class ImageTaskView(BaseView):
 
         # Load and prepare the first image in the sequence
         self._load_current_image()
-        self.display_start_time = time.time()  # Record the start time for the image display
+        self.display_start_ms = pygame.time.get_ticks()  # Record the start time for the image display
 
     def _load_current_image(self) -> None:
         """
@@ -88,7 +249,8 @@ class ImageTaskView(BaseView):
         
         This method loads the image at the current index, scales it to fit within the
         display dimensions while maintaining aspect ratio, and centers it on the screen.
-        If an image fails to load, it is skipped, and the current image properties are cleared.
+        Scaled images are cached, see _load_scaled. If an image fails to load, it is
+        skipped, and the current image properties are cleared.
         """
         if self.current_idx >= len(self.image_paths):
             # Current index exceeds available images; clear current image properties
@@ -97,29 +259,16 @@ class ImageTaskView(BaseView):
             return
 
         image_path = self.image_paths[self.current_idx]
+        if self._prefetch is not None and self._prefetch[0] == self.current_idx:
+            # Wait for the background load of this image instead of loading it a second time;
+            # a failed load is reported below when the image is loaded again
+            self._prefetch[1].exception()
         try:
-            # Load the image from the specified file path
-            original = pygame.image.load(image_path)
-            img_width = original.get_width()
-            img_height = original.get_height()
-
-            # Calculate scaling factor to fit the image within the display while maintaining aspect ratio
-            width_ratio = self.width / img_width
-            height_ratio = self.height / img_height
-            scale_factor = min(width_ratio, height_ratio)
-
-            new_width = int(img_width * scale_factor)
-            new_height = int(img_height * scale_factor)
-
-            # Smoothly scale the image to the new dimensions
-            self.current_image = pygame.transform.smoothscale(
-                original, (new_width, new_height)
+            # Load and scale the image, or reuse it if it was shown before
+            self.current_image, rect = _load_scaled(
+                image_path, self.width, self.height, self.SMOOTH_SCALING
             )
-
-            # Center the image on the screen
-            x = (self.width - new_width) // 2
-            y = (self.height - new_height) // 2
-            self.image_rect = pygame.Rect(x, y, new_width, new_height)
+            self.image_rect = pygame.Rect(rect)
 
         except pygame.error as e:
             # Log an error message if the image fails to load and clear current image properties
@@ -127,23 +276,44 @@ class ImageTaskView(BaseView):
             self.current_image = None
             self.image_rect = None
 
+        self._prefetch_next_image()
+
+    def _prefetch_next_image(self) -> None:
+        """
+        Start loading the image after the current one in the background.
+        
+        The scaled image ends up in the _load_scaled cache, so moving on to it does not
+        stall the main thread on decoding and scaling while the display time runs.
+        """
+        next_idx = self.current_idx + 1
+        if next_idx >= len(self.image_paths):
+            self._prefetch = None
+            return
+        # Re-initialize the executor if it has been shut down, see cleanup()
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(max_workers=1)
+        self._prefetch = (next_idx, self._prefetch_executor.submit(
+            _load_scaled, self.image_paths[next_idx], self.width, self.height, self.SMOOTH_SCALING
+        ))
+
     def check_image_complete(self) -> bool:
         """
         Determine if the current image's display time has elapsed.
         
         This method compares the elapsed time since the image started displaying with the
-        predefined IMAGE_DISPLAY_TIME.
+        predefined IMAGE_DISPLAY_TIME_MS, in integer milliseconds of pygame's tick counter.
         
         Returns:
             bool: True if the display time has elapsed; False otherwise.
         """
-        if self.sequence_complete or self.display_start_time is None:
+        if self.sequence_complete or self.display_start_ms is None:
             # Sequence is complete or display has not started; no completion to check
             return False
 
-        # Calculate the elapsed time since the image started displaying
-        time_elapsed = time.time() - self.display_start_time
-        return time_elapsed >= self.IMAGE_DISPLAY_TIME
+        # Calculate the elapsed time since the image started displaying; pygame's tick counter
+        # is monotonic and unaffected by system clock adjustments
+        time_elapsed = pygame.time.get_ticks() - self.display_start_ms
+        return time_elapsed >= self.IMAGE_DISPLAY_TIME_MS
 
     def next_image(self) -> None:
         """
@@ -163,7 +333,7 @@ class ImageTaskView(BaseView):
 
         # Load and prepare the next image in the sequence
         self._load_current_image()
-        self.display_start_time = time.time()  # Reset the display start time for the new image
+        self.display_start_ms = pygame.time.get_ticks()  # Reset the display start time for the new image
         self.fade_alpha = 255                 # Reset fade alpha (currently unused)
 
     def is_sequence_complete(self) -> bool:
@@ -184,6 +354,19 @@ class ImageTaskView(BaseView):
         """
         return max(0, len(self.image_paths) - self.current_idx)
 
+    def cleanup(self) -> None:
+        """
+        Stop loading images in the background.
+        
+        A prefetch that has not started yet is cancelled; one that is running is waited for,
+        so no worker thread is still converting a surface when Pygame is shut down. The
+        executor is re-created on the next prefetch.
+        """
+        if self._prefetch_executor:
+            self._prefetch_executor.shutdown(wait=True, cancel_futures=True)
+            self._prefetch_executor = None  # Set to None to allow re-initialization if needed
+        self._prefetch = None
+
     def reset(self) -> None:
         """
         Reset the ImageTaskView for a fresh run of the image sequence.
@@ -194,19 +377,21 @@ class ImageTaskView(BaseView):
         """
         self.current_idx = 0
         self.sequence_complete = False
-        self.display_start_time = None
+        self.display_start_ms = None
         self.fade_alpha = 255
+        self._last_draw_state = None  # Another view may have drawn to the screen meanwhile
 
         if self.image_paths:
             # Load the first image and record the display start time
             self._load_current_image()
-            self.display_start_time = time.time()
+            self.display_start_ms = pygame.time.get_ticks()
 
     def draw(
         self,
         current_gaze: Optional[Tuple[int, int]],
         gaze_history: Deque[Tuple[int, int]],
         remaining_images: int,
+        history_version: Optional[int] = None,
     ) -> None:
         """
         Render the current image with optional gaze visualization.
@@ -214,34 +399,86 @@ class ImageTaskView(BaseView):
         This method clears the screen, draws the current image, overlays the heatmap if available,
         and renders gaze visualization (trail and glow) if enabled. It also displays minimal
         debug information such as gaze coordinates, remaining images, and the current system time.
+        If none of these changed since the last frame, the frame still on the display is kept
+        and nothing is drawn. While the image stays the same, only the areas covered by the
+        overlays of the previous and the current frame are redrawn and sent to the display.
         
         Args:
             current_gaze (Optional[Tuple[int, int]]): The latest smoothed gaze position.
             gaze_history (Deque[Tuple[int, int]]): A deque containing the history of recent gaze positions.
             remaining_images (int): The number of images left to display in the sequence.
+            history_version (Optional[int]): A number that changes whenever gaze_history
+                changes, see GazeProcessor.history_version. Without it, frames showing the
+                gaze trail are never skipped.
         """
-        # Clear the screen with the background color
-        self.screen.fill(self.BACKGROUND_COLOR)
-
-        # Draw the current image if one is loaded
-        if self.current_image and self.image_rect:
-            self.screen.blit(self.current_image, self.image_rect)
+        # Everything the frame depends on; the clock shows whole seconds. The trail is
+        # tracked by the history's version instead of comparing the points themselves
+        self._frame_second = int(time.time())
+        trail_shown = bool(self.show_gaze_overlay and current_gaze)
+        state = (
+            self.current_image,
+            current_gaze,
+            remaining_images,
+            self.show_gaze_overlay,
+            self._frame_second,
+            history_version if trail_shown else None
+        )
+        if state == self._last_draw_state and not (trail_shown and history_version is None):
+            return
+        full_redraw = (
+            self._last_draw_state is None or self._last_draw_state[0] is not self.current_image
+        )
+        self._last_draw_state = state
+
+        if full_redraw:
+            # Clear the screen with the background color
+            self.screen.fill(self.BACKGROUND_COLOR)
+
+            # Draw the current image if one is loaded
+            if self.current_image and self.image_rect:
+                self.screen.blit(self.current_image, self.image_rect)
+            restored = []
+        else:
+            # Restore the background and image where the last frame's overlays were
+            restored = self._overlay_rects
+            for rect in restored:
+                self._restore_background(rect)
 
+        overlay_rects = []
         # Draw gaze visualization if enabled and a valid gaze position is available
         if self.show_gaze_overlay and current_gaze:
-            self.draw_gaze(current_gaze, gaze_history)
+            overlay_rects += self.draw_gaze(current_gaze, gaze_history)
 
         # Draw minimal debug information (gaze coordinates, remaining images, current time)
-        self.draw_debug_info(current_gaze, remaining_images)
+        overlay_rects += self.draw_debug_info(current_gaze, remaining_images)
+        self._overlay_rects = overlay_rects
+
+        if full_redraw:
+            # Update the entire display
+            pygame.display.flip()
+        else:
+            # Only send the areas that changed to the display
+            pygame.display.update(restored + overlay_rects)
 
-        # Update the entire display
-        pygame.display.flip()
+    def _restore_background(self, rect: pygame.Rect) -> None:
+        """
+        Redraw the background and the current image within a screen area.
+        
+        Args:
+            rect (pygame.Rect): The screen area to restore.
+        """
+        self.screen.fill(self.BACKGROUND_COLOR, rect)
+        if self.current_image and self.image_rect:
+            visible = rect.clip(self.image_rect)
+            if visible:
+                area = visible.move(-self.image_rect.x, -self.image_rect.y)
+                self.screen.blit(self.current_image, visible, area)
 
     def draw_gaze(
         self,
         current_gaze: Tuple[int, int],
         gaze_history: Deque[Tuple[int, int]],
-    ) -> None:
+    ) -> List[pygame.Rect]:
         """
         Draw the gaze trail and glow effect on a transparent surface.
         
@@ -252,53 +489,57 @@ class ImageTaskView(BaseView):
         Args:
             current_gaze (Tuple[int, int]): The latest smoothed gaze position.
             gaze_history (Deque[Tuple[int, int]]): A deque containing the history of recent gaze positions.
+        
+        Returns:
+            List[pygame.Rect]: The screen areas drawn to.
         """
         # Clear the gaze surface to remove previous drawings
         self.clear_surface(self.gaze_surface)
 
         # Draw a trail of older gaze points if there are multiple points in history
         if len(gaze_history) > 1:
-            points = list(gaze_history)
-            for i in range(len(points) - 1):
-                # Calculate progress along the trail for dynamic effects
-                progress = i / (len(points) - 1)
-                alpha = int(180 * progress)  # Fade out the trail
-                size = int(self.GAZE_RADIUS * 0.5 * (1 - progress))  # Decrease size for older points
-
-                # Draw smaller anti-aliased circles for the trail
-                self.draw_aa_circle(
-                    self.gaze_surface,
-                    points[i],
-                    size,
-                    (*self.GAZE_COLOR, alpha),
-                )
+            surface = self.gaze_surface
+            # Every segment has its own alpha and is overwritten in part by the next point's
+            # circle, so the lines cannot be merged into one pygame.draw.lines polyline;
+            # bind the per-segment calls locally instead. The surface is not locked around
+            # the loop either: blitting onto a locked surface fails, and pygame.draw's own
+            # lock is free on a plain software surface without RLE
+            blit = surface.blit
+            draw_line = pygame.draw.line
+            mult, add = pygame.BLEND_RGBA_MULT, pygame.BLEND_RGBA_ADD
+            trail_rects = []
+            # Pair consecutive points by iterating the deque twice, without copying it
+            for start, end, (sprites, offset, color) in zip(
+                gaze_history,
+                itertools.islice(gaze_history, 1, None),
+                self._get_trail_styles(len(gaze_history))
+            ):
+                # Stamp the smaller anti-aliased circle for the trail point, like draw_aa_circle
+                if sprites is not None:
+                    pos = (start[0] - offset, start[1] - offset)
+                    blit(sprites[0], pos, None, mult)
+                    trail_rects.append(blit(sprites[1], pos, None, add))
                 # Draw lines connecting the trail points for continuity
-                pygame.draw.line(
-                    self.gaze_surface,
-                    (*self.GAZE_COLOR, alpha),
-                    points[i],
-                    points[i + 1],
-                    2,  # Line thickness
-                )
-
-        # Draw a glow effect at the current gaze position
-        for radius in range(self.GAZE_RADIUS + 12, self.GAZE_RADIUS - 12, -1):
-            alpha = int(130 * (radius / self.GAZE_RADIUS))
-            self.draw_aa_circle(
-                self.gaze_surface,
-                current_gaze,
-                radius,
-                (*self.GAZE_COLOR, alpha),
-            )
-
-        # Blit the gaze surface onto the main screen to overlay the gaze visualization
-        self.screen.blit(self.gaze_surface, (0, 0))
+                trail_rects.append(draw_line(surface, color, start, end, 2))
+            self.register_dirty(surface, trail_rects[0].unionall(trail_rects[1:]))
+
+        # The glow covers the trail underneath it: punch its area out of the trail, overlay
+        # the drawn areas of the gaze surface onto the main screen (the rest of the surface
+        # is transparent), then blend the pre-rendered glow straight onto the screen
+        offset = self.GAZE_RADIUS + 13
+        pos = (current_gaze[0] - offset, current_gaze[1] - offset)
+        self.gaze_surface.blit(self._glow_punch, pos, special_flags=pygame.BLEND_RGBA_MULT)
+        drawn = self.blit_dirty(self.gaze_surface)
+        drawn.append(
+            self.screen.blit(self._glow_sprite, pos, special_flags=pygame.BLEND_PREMULTIPLIED)
+        )
+        return drawn
 
     def draw_debug_info(
         self,
         current_gaze: Optional[Tuple[int, int]],
         remaining_images: int,
-    ) -> None:
+    ) -> List[pygame.Rect]:
         """
         Display minimal debug information on the screen.
         
@@ -309,6 +550,9 @@ class ImageTaskView(BaseView):
         Args:
             current_gaze (Optional[Tuple[int, int]]): The latest smoothed gaze position.
             remaining_images (int): The number of images left to display in the sequence.
+        
+        Returns:
+            List[pygame.Rect]: The screen areas drawn to.
         """
         if current_gaze:
             # Format the gaze coordinates for display
@@ -317,15 +561,34 @@ class ImageTaskView(BaseView):
             # Display 'NaN' if no valid gaze position is available
             gaze_text = "X: NaN  Y: NaN"
 
-        # Render and position the gaze coordinates at (20, 20) pixels
-        self.draw_text(gaze_text, (20, 20))
-        # Render and position the remaining images count at (20, 60) pixels
-        self.draw_text(f"Remaining images: {remaining_images}", (20, 60))
+        # Render and position the gaze coordinates at (20, 20) pixels; they change every
+        # frame, so they are drawn directly instead of going through the text cache
+        drawn = [self.draw_text(gaze_text, (20, 20), cache=False)]
+        # Get the frame's system time in a readable format, formatting it once per second
+        if self._frame_second != self._clock_second:
+            self._clock_second = self._frame_second
+            self._clock_text = datetime.fromtimestamp(self._frame_second).strftime(
+                "%Y-%m-%d %H:%M:%S"
+            )
+        current_time = self._clock_text
+
+        # Draw the remaining images count at (20, 60) pixels and the current time near the
+        # top-right corner in a single batch of blits
+        drawn += self.screen.blits(
+            self.render_text(f"Remaining images: {remaining_images}", (20, 60))
+            + self.render_text(current_time, (self.width - 300, 20))
+        )
+        return drawn
 
-        # Get the current system time in a readable format
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        # Render and position the current time near the top-right corner
-        self.draw_text(current_time, (self.width - 300, 20))
+    def invalidate(self) -> None:
+        """
+        Force the next draw() call to redraw the whole screen.
+        
+        Frames whose content did not change are skipped and otherwise only the overlay
+        areas are redrawn; call this when the screen content was lost from outside the
+        view, e.g. after the window was uncovered.
+        """
+        self._last_draw_state = None
 
     def toggle_gaze_overlay(self) -> None:
         """